@@ -0,0 +1,239 @@
+from Models.RecordModels import *
+from Models.CoreModels import *
+from typing import Iterator, NamedTuple
+
+
+class PlayedGame(NamedTuple):
+    """
+    Determines moves of a game and names of its players, which is the input of analyze_games.
+    """
+    moves: tuple  # Positions in order they were played, starting with the move of first player.
+    first_player: str
+    second_player: str
+    first_marker: PlayerMarker
+
+
+class MoveAnalysis(NamedTuple):
+    """
+    Determines result of analysis of a move.
+    Values are from point of view of the player who moved: 1 => win, 0 => tie (or no result within search depth),
+    -1 => loss, with the best play of both players after the move.
+    """
+    ply: int  # Number of moves which were made before this move.
+    player: str
+    position: int
+    best_position: int
+    best_value: int
+    value: int
+    missed_win: bool  # Player could win immediately but did not.
+    missed_block: bool  # Player could not win, but could stop the only winning move of opponent and did not.
+
+    # Determines that if move turned a position that was not lost into a lost one.
+    @property
+    def is_blunder(self) -> bool:
+        return self.value < self.best_value and self.value == -1
+
+    # Determines that if move threw away a win but did not lose.
+    @property
+    def is_mistake(self) -> bool:
+        return self.value < self.best_value and self.value != -1
+
+
+class GameAnalysis(NamedTuple):
+    """
+    Determines result of analysis of a game.
+    """
+    game: PlayedGame
+    moves: tuple  # MoveAnalysis of every move, in order.
+    winner: str | None
+
+
+class PositionEvaluator:
+    """
+    Evaluates positions by negamax search on a Board with make/unmake moves.
+    Results are memoized by Zobrist hash of board and the marker to move, so positions which are repeated in many
+    games are only searched once. The cache is cleared when it has max_entries positions, so memory stays bounded.
+    """
+
+    def __init__(self, max_depth: int | None = None, max_entries: int = 1000000):
+        """
+        Initializes PositionEvaluator class.
+        :param max_depth: Maximum number of moves which are searched after a move. Search goes until the end of the
+        game when it is None, which is only practical on small boards.
+        :param max_entries: Maximum number of positions in cache.
+        """
+        self.__max_depth = max_depth
+        self.__max_entries = max_entries
+        self.__cache = {}
+        self.__hits = 0
+        self.__misses = 0
+
+    # Determines number of evaluations which were read from cache.
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    # Determines number of evaluations which needed a search.
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def evaluate_moves(self, board: Board, player_marker: PlayerMarker) -> dict:
+        """
+        Evaluates every unoccupied position of an unfinished board as the move of player.
+        :param board: Board of the game. It is the same after evaluation.
+        :param player_marker: Determines player (X or O) who should move.
+        :return: Dictionary of position => value of the move for player.
+        """
+        depth = board.width * board.height if self.__max_depth is None else self.__max_depth
+        return {position: self.__evaluate_move(board, player_marker, position, depth)
+                for position in board.check_unoccupied_places(*board.places)}
+
+    def __evaluate_move(self, board: Board, player_marker: PlayerMarker, position: int, depth: int) -> int:
+        board.make_move(position, player_marker)
+        if board.check_winner(player_marker):
+            value = 1
+        elif board.is_full:
+            value = 0
+        else:
+            value = -self.__evaluate(board, player_marker.opponent, depth)
+        board.unmake_move()
+        return value
+
+    def __evaluate(self, board: Board, player_marker: PlayerMarker, depth: int) -> int:
+        # Value of an unfinished position for the player who should move.
+        key = (board.hash, player_marker)
+        entry = self.__cache.get(key)
+        # A win or loss which was found once is forced at any depth; a tie is only reused if search was as deep.
+        if entry is not None and (entry[0] or entry[1] >= depth):
+            self.__hits += 1
+            return entry[0]
+        self.__misses += 1
+        if depth == 0:
+            return 0
+        best_value = -1
+        for position in board.check_unoccupied_places(*board.places):
+            value = self.__evaluate_move(board, player_marker, position, depth - 1)
+            if value > best_value:
+                best_value = value
+                if value == 1:
+                    break
+        if len(self.__cache) >= self.__max_entries:
+            self.__cache.clear()
+        self.__cache[key] = (best_value, depth)
+        return best_value
+
+
+class PlayerStatistics:
+    """
+    Determines statistics of the moves of a player (user, computer or a strategy) in analyzed games.
+    """
+
+    def __init__(self):
+        """
+        Initializes PlayerStatistics class.
+        """
+        self.games = 0
+        self.wins = 0
+        self.losses = 0
+        self.moves = 0
+        self.best_moves = 0
+        self.mistakes = 0
+        self.blunders = 0
+        self.missed_wins = 0
+        self.missed_blocks = 0
+
+    # Determines share of moves which were as good as the best move.
+    @property
+    def accuracy(self) -> float:
+        return self.best_moves / self.moves if self.moves else 0.0
+
+    def add_move(self, move: MoveAnalysis) -> None:
+        """
+        Adds analysis of a move of player.
+        :param move: Analysis of the move.
+        :return: None
+        """
+        self.moves += 1
+        self.best_moves += move.value == move.best_value
+        self.mistakes += move.is_mistake
+        self.blunders += move.is_blunder
+        self.missed_wins += move.missed_win
+        self.missed_blocks += move.missed_block
+
+
+def games_from_records(records) -> Iterator[PlayedGame]:
+    """
+    Converts game records (e.g. of a GameRecordReader) to games between "user" and "computer" lazily.
+    :param records: Iterable of GameRecord.
+    :return: Generator of PlayedGame.
+    """
+    for record in records:
+        if record.computer_started:
+            yield PlayedGame(record.moves, "computer", "user", record.user_marker.opponent)
+        else:
+            yield PlayedGame(record.moves, "user", "computer", record.user_marker)
+
+
+def analyze_games(games, width: int = 3, height: int = 3, win_length: int = 3,
+                  evaluator: PositionEvaluator | None = None) -> Iterator[GameAnalysis]:
+    """
+    Replays games and analyzes every move against the best move of its position.
+    Games are read one at a time from the input, so input of any size is analyzed with constant memory.
+    :param games: Iterable of PlayedGame.
+    :param width: Number of columns of board of the games.
+    :param height: Number of rows of board of the games.
+    :param win_length: Number of markers in a row which are needed to win the games.
+    :param evaluator: PositionEvaluator which is shared by all games. A PositionEvaluator which searches until the end
+    of the game is used when it is None.
+    :return: Generator of GameAnalysis.
+    """
+    evaluator = evaluator if evaluator is not None else PositionEvaluator()
+    board = Board(width, height, win_length)
+    for game in games:
+        board.clear()
+        players = (game.first_player, game.second_player)
+        markers = (game.first_marker, game.first_marker.opponent)
+        analyses = []
+        winner = None
+        for ply, position in enumerate(game.moves):
+            player_marker = markers[ply % 2]
+            values = evaluator.evaluate_moves(board, player_marker)
+            best_position = max(values, key=values.get)
+            winning_move = board.get_winning_move(player_marker)
+            missed_block = False
+            threat = board.get_winning_move(player_marker.opponent)
+            if winning_move is None and threat is not None and position != threat:
+                # Block was missed only if blocking would have left opponent without any winning move.
+                board.make_move(threat, player_marker)
+                missed_block = board.get_winning_move(player_marker.opponent) is None
+                board.unmake_move()
+            board.make_move(position, player_marker)
+            won = board.check_winner(player_marker)
+            analyses.append(MoveAnalysis(ply, players[ply % 2], position, best_position, values[best_position],
+                                         values[position], winning_move is not None and not won, missed_block))
+            if won:
+                winner = players[ply % 2]
+                break
+        yield GameAnalysis(game, tuple(analyses), winner)
+
+
+def summarize(analyses) -> dict:
+    """
+    Aggregates analyses of games by player.
+    :param analyses: Iterable of GameAnalysis.
+    :return: Dictionary of player name => PlayerStatistics.
+    """
+    statistics = {}
+    for analysis in analyses:
+        for player in dict.fromkeys((analysis.game.first_player, analysis.game.second_player)):
+            player_statistics = statistics.setdefault(player, PlayerStatistics())
+            player_statistics.games += 1
+            if analysis.winner is not None:
+                if analysis.winner == player:
+                    player_statistics.wins += 1
+                else:
+                    player_statistics.losses += 1
+        for move in analysis.moves:
+            statistics[move.player].add_move(move)
+    return statistics
@@ -0,0 +1,172 @@
+from Models.CoreModels import *
+import numpy as np
+
+EMPTY, CROSS, CIRCLE = 0, 1, 2  # Values of cells in a BoardBatch.
+
+
+class BoardBatch:
+    """
+    Determines many boards of the same size which are evaluated together using NumPy.
+    Boards are stored as an (N, cells) integer array (0 => empty, 1 => X, 2 => O) and every operation works on
+    the whole batch against a precomputed (cells, wining cases) incidence matrix, without any Python loop per board.
+    """
+
+    def __init__(self, count: int, width: int = 3, height: int = 3, win_length: int = 3):
+        """
+        Initializes BoardBatch class with count empty boards. X moves first on every board.
+        :param count: Number of boards.
+        :param width: Number of columns of boards.
+        :param height: Number of rows of boards.
+        :param win_length: Number of markers in a row which are needed to win the game.
+        """
+        Board(width, height, win_length)  # Validates size of boards.
+        self.__width = width
+        self.__height = height
+        self.__win_length = win_length
+        size = width * height
+        cases = Board.get_wining_cases(width, height, win_length)
+        # incidence[i, j] is 1 when position i belongs to wining case j.
+        self.__incidence = np.zeros((size, len(cases)), dtype=np.float32)
+        for j, case in enumerate(cases):
+            self.__incidence[list(case), j] = 1
+        self.cells = np.zeros((count, size), dtype=np.int8)
+        self.turns = np.full(count, CROSS, dtype=np.int8)  # Marker which should move on each board.
+        # Priority of positions for the rules of ComputerPlayer: corners, then centers, then the others.
+        self.__priority = np.zeros(size, dtype=np.float32)
+        probe = Board(width, height, win_length)
+        self.__priority[list(probe.centers)] = 1
+        self.__priority[list(probe.corners)] = 2
+
+    @classmethod
+    def from_boards(cls, boards: list) -> "BoardBatch":
+        """
+        Creates a batch from Board objects. All boards should have the same size.
+        Marker which should move on each board is determined by number of markers on it.
+        :param boards: List of Board objects.
+        :return: A BoardBatch
+        """
+        first = boards[0]
+        batch = cls(len(boards), first.width, first.height, first.win_length)
+        positions = np.arange(first.width * first.height)
+        for i, board in enumerate(boards):
+            cross = board.bitboard(PlayerMarker.Cross)
+            circle = board.bitboard(PlayerMarker.Circle)
+            batch.cells[i, [p for p in positions if cross >> int(p) & 1]] = CROSS
+            batch.cells[i, [p for p in positions if circle >> int(p) & 1]] = CIRCLE
+            batch.turns[i] = CROSS if cross.bit_count() <= circle.bit_count() else CIRCLE
+        return batch
+
+    def to_board(self, index: int) -> Board:
+        """
+        Creates a Board object from one board of the batch.
+        :param index: Index of board in the batch.
+        :return: A Board
+        """
+        board = Board(self.__width, self.__height, self.__win_length)
+        for position in np.flatnonzero(self.cells[index] == CROSS):
+            board.update_board(x=int(position))
+        for position in np.flatnonzero(self.cells[index] == CIRCLE):
+            board.update_board(o=int(position))
+        return board
+
+    # Determines number of boards in the batch.
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def line_counts(self, marker: int) -> np.ndarray:
+        """
+        Counts markers of a player in each wining case of each board.
+        :param marker: CROSS or CIRCLE
+        :return: (N, wining cases) array of counts
+        """
+        return (self.cells == marker).astype(np.float32) @ self.__incidence
+
+    def check_winner(self, marker: int) -> np.ndarray:
+        """
+        Checks that which boards are won by a player.
+        :param marker: CROSS or CIRCLE
+        :return: (N,) boolean array
+        """
+        return (self.line_counts(marker) == self.__win_length).any(axis=1)
+
+    def winners(self) -> np.ndarray:
+        """
+        Gets winner of each board.
+        :return: (N,) array; CROSS or CIRCLE for won boards and EMPTY for the others.
+        """
+        result = np.zeros(len(self.cells), dtype=np.int8)
+        result[self.check_winner(CROSS)] = CROSS
+        result[self.check_winner(CIRCLE)] = CIRCLE
+        return result
+
+    def unoccupied_places(self) -> np.ndarray:
+        """
+        Gets legal moves of each board.
+        :return: (N, cells) boolean array which is True for unoccupied positions.
+        """
+        return self.cells == EMPTY
+
+    def winning_move_mask(self, marker: int) -> np.ndarray:
+        """
+        Gets every move that makes a player winner on each board.
+        :param marker: CROSS or CIRCLE
+        :return: (N, cells) boolean array which is True for winning moves of player.
+        """
+        other = CIRCLE if marker == CROSS else CROSS
+        # Wining cases that player needs only one more marker in and the other player has no marker in.
+        open_cases = (self.line_counts(marker) == self.__win_length - 1) & (self.line_counts(other) == 0)
+        return (open_cases.astype(np.float32) @ self.__incidence.T > 0) & self.unoccupied_places()
+
+    def get_winning_moves(self, marker: int) -> np.ndarray:
+        """
+        Gets one winning move of a player on each board (today's Board.get_winning_move for the whole batch).
+        :param marker: CROSS or CIRCLE
+        :return: (N,) array of positions; -1 for boards that player cannot win in one move.
+        """
+        mask = self.winning_move_mask(marker)
+        return np.where(mask.any(axis=1), mask.argmax(axis=1), -1)
+
+    def finished(self) -> np.ndarray:
+        """
+        Gets which boards are finished (won by a player or full).
+        :return: (N,) boolean array
+        """
+        return (self.winners() != EMPTY) | ~self.unoccupied_places().any(axis=1)
+
+    def step(self, rng: np.random.Generator, policy: str = "rules") -> np.ndarray:
+        """
+        Makes one move on every board which is not finished.
+        :param rng: Random generator which breaks ties between moves.
+        :param policy: "random" plays a random legal move; "rules" plays like ComputerPlayer
+        (win, block, corners, centers, then any other position).
+        :return: (N,) boolean array of boards which a move was made on.
+        """
+        active = ~self.finished()
+        legal = self.unoccupied_places()
+        scores = rng.random(self.cells.shape, dtype=np.float32)
+        if policy == "rules":
+            scores += self.__priority
+            cross_wins = self.winning_move_mask(CROSS)
+            circle_wins = self.winning_move_mask(CIRCLE)
+            own = np.where((self.turns == CROSS)[:, None], cross_wins, circle_wins)
+            other = np.where((self.turns == CROSS)[:, None], circle_wins, cross_wins)
+            scores += 8 * own + 4 * other
+        elif policy != "random":
+            raise ValueError(f"Unknown policy: {policy}")
+        scores[~legal] = -1
+        moves = scores.argmax(axis=1)
+        rows = np.flatnonzero(active)
+        self.cells[rows, moves[rows]] = self.turns[rows]
+        self.turns[rows] = np.where(self.turns[rows] == CROSS, CIRCLE, CROSS)
+        return active
+
+    def play(self, rng: np.random.Generator, policy: str = "rules") -> np.ndarray:
+        """
+        Plays every board of the batch until it is finished.
+        :param rng: Random generator which breaks ties between moves.
+        :param policy: Policy of both players (see step).
+        :return: (N,) array of winners; EMPTY for ties.
+        """
+        while self.step(rng, policy).any():
+            pass
+        return self.winners()
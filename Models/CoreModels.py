@@ -0,0 +1,650 @@
+from Models.HelpingModels import *
+import functools
+import random
+import time
+
+
+class Board:
+    """
+    Determines Board model.
+    Board has width * height positions and a player wins by having win_length markers in a row
+    (horizontally, vertically or diagonally). Position numbers are row * width + column.
+    Board is stored as two bitboards (one integer per marker), bit i of a bitboard is set when position i
+    of board is occupied by that marker.
+    Moves can be taken back with unmake_move, and board keeps a Zobrist hash of its position which is updated
+    incrementally by every move, so searches and caches do not need to copy boards.
+    """
+    # Directions (row step, column step) that a row of markers can be made in.
+    directions = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+    def __init__(self, width: int = 3, height: int = 3, win_length: int = 3):
+        """
+        Initializes Board class.
+        :param width: Number of columns of board.
+        :param height: Number of rows of board.
+        :param win_length: Number of markers in a row which are needed to win the game.
+        """
+        if width < 1 or height < 1:
+            raise ValueError("Width and height of board should be positive.")
+        if not 1 <= win_length <= max(width, height):
+            raise ValueError("Win length should be between 1 and the longest side of board.")
+        self.__width = width
+        self.__height = height
+        self.__win_length = win_length
+        self.__full_mask = (1 << width * height) - 1
+        # Create Default Board (No position is occupied)
+        self.__cross = 0
+        self.__circle = 0
+        # Winners are detected incrementally whenever a marker is placed.
+        self.__cross_won = False
+        self.__circle_won = False
+        self.__zobrist_keys = Board.get_zobrist_keys(width, height)
+        self.__hash = 0
+        # Moves which were made so far as (position, marker, whether player had won before the move).
+        self.__move_stack = []
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_wining_cases(width: int, height: int, win_length: int) -> tuple:
+        """
+        Gets all wining cases of a board. Result is computed once for each size of board.
+        :return: Tuple of wining cases, each one is a tuple of positions.
+        """
+        cases = []
+        for row in range(height):
+            for column in range(width):
+                for row_step, column_step in Board.directions:
+                    last_row = row + row_step * (win_length - 1)
+                    last_column = column + column_step * (win_length - 1)
+                    if 0 <= last_row < height and 0 <= last_column < width:
+                        cases.append(tuple((row + row_step * i) * width + column + column_step * i
+                                           for i in range(win_length)))
+        return tuple(cases)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_neighbour_masks(width: int, height: int, distance: int) -> tuple:
+        """
+        Gets mask of the positions around each position of a board. Result is computed once for each size of board.
+        :param distance: Maximum distance (in rows and columns) of a neighbour from the position.
+        :return: Tuple that its item i is bitmask of neighbours of position i.
+        """
+        masks = []
+        for position in range(width * height):
+            row, column = divmod(position, width)
+            mask = 0
+            for r in range(max(0, row - distance), min(height, row + distance + 1)):
+                for c in range(max(0, column - distance), min(width, column + distance + 1)):
+                    mask |= 1 << r * width + c
+            masks.append(mask & ~(1 << position))
+        return tuple(masks)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_completing_masks(width: int, height: int, win_length: int) -> tuple:
+        """
+        Gets pairs of (mask of a wining case without one of its positions, mask of that position).
+        Used for finding winning moves without building any list or set.
+        """
+        masks = []
+        for case in Board.get_wining_cases(width, height, win_length):
+            mask = sum(1 << i for i in case)
+            for i in case:
+                masks.append((mask & ~(1 << i), 1 << i))
+        return tuple(masks)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_zobrist_keys(width: int, height: int) -> tuple:
+        """
+        Gets random 64-bit keys of each marker on each position of a board. Result is computed once for each size of
+        board, and keys are the same in every process so hashes can be shared.
+        :return: (keys of X, keys of O); item i of each one is the key of that marker on position i.
+        """
+        generator = random.Random(f"zobrist {width}x{height}")
+        return tuple(tuple(generator.getrandbits(64) for _ in range(width * height)) for _ in range(2))
+
+    # Determines number of columns of board.
+    @property
+    def width(self) -> int:
+        return self.__width
+
+    # Determines number of rows of board.
+    @property
+    def height(self) -> int:
+        return self.__height
+
+    # Determines number of markers in a row which are needed to win the game.
+    @property
+    def win_length(self) -> int:
+        return self.__win_length
+
+    # Determines all position numbers of board.
+    @property
+    def places(self) -> range:
+        return range(self.__width * self.__height)
+
+    # Determines positions of the corners of board.
+    @property
+    def corners(self) -> tuple:
+        size = self.__width * self.__height
+        return tuple(sorted({0, self.__width - 1, size - self.__width, size - 1}))
+
+    # Determines positions of the center of board (more than one for boards with even sides).
+    @property
+    def centers(self) -> tuple:
+        rows = sorted({(self.__height - 1) // 2, self.__height // 2})
+        columns = sorted({(self.__width - 1) // 2, self.__width // 2})
+        return tuple(row * self.__width + column for row in rows for column in columns)
+
+    # Determines bitmask of a board that all of its positions are occupied.
+    @property
+    def full_mask(self) -> int:
+        return self.__full_mask
+
+    # Determines bitmask of all occupied positions of board.
+    @property
+    def occupied(self) -> int:
+        return self.__cross | self.__circle
+
+    # Determines Zobrist hash of position of board; XOR of the keys of all markers on board.
+    @property
+    def hash(self) -> int:
+        return self.__hash
+
+    # Determines moves which were made so far as (position, marker) pairs, in order.
+    @property
+    def move_stack(self) -> tuple:
+        return tuple((position, marker) for position, marker, _ in self.__move_stack)
+
+    # Determines that if there is no unoccupied position on board.
+    @property
+    def is_full(self) -> bool:
+        return self.__cross | self.__circle == self.__full_mask
+
+    def clear(self) -> None:
+        """
+        Removes all markers from board.
+        :return: None
+        """
+        self.__cross = 0
+        self.__circle = 0
+        self.__cross_won = False
+        self.__circle_won = False
+        self.__hash = 0
+        self.__move_stack = []
+
+    def set_position(self, cross: int, circle: int, cross_won: bool = False, circle_won: bool = False) -> None:
+        """
+        Replaces markers of board with bitboards, e.g. of a game which was stored compactly. Winners are given instead
+        of being detected, because whoever stored the bitboards already knows them. Move stack is cleared, so the
+        moves before it cannot be taken back.
+        :param cross: Bitboard of X.
+        :param circle: Bitboard of O.
+        :param cross_won: Determines that if X has a row.
+        :param circle_won: Determines that if O has a row.
+        :return: None
+        """
+        if cross & circle or (cross | circle) & ~self.__full_mask:
+            raise ValueError("Bitboards should not overlap and should be on board.")
+        self.__cross = cross
+        self.__circle = circle
+        self.__cross_won = cross_won
+        self.__circle_won = circle_won
+        self.__move_stack = []
+        value = 0
+        for keys, bits in zip(self.__zobrist_keys, (cross, circle)):
+            while bits:
+                bit = bits & -bits
+                bits ^= bit
+                value ^= keys[bit.bit_length() - 1]
+        self.__hash = value
+
+    def __copy__(self):
+        # Copies of a board should not share the move stack.
+        board = Board.__new__(Board)
+        board.__dict__.update(self.__dict__)
+        board.__move_stack = list(self.__move_stack)
+        return board
+
+    def bitboard(self, player_marker: PlayerMarker) -> int:
+        """
+        Gets bitboard of a player.
+        :param player_marker: Determines player (X or O).
+        :return: Bitmask of positions that player selected.
+        """
+        if player_marker == PlayerMarker.Cross:
+            return self.__cross
+        if player_marker == PlayerMarker.Circle:
+            return self.__circle
+        return 0
+
+    def update_board(self, x=None, o=None) -> None:
+        """
+        Makes changes on board according to values of x and o params.
+        :param x: Position of X on board
+        :param o: Position of O on board
+        :return: None
+        """
+        if x is not None:
+            self.make_move(x, PlayerMarker.Cross)
+        if o is not None:
+            self.make_move(o, PlayerMarker.Circle)
+
+    def make_move(self, position: int, player_marker: PlayerMarker) -> None:
+        """
+        Places marker of player on position, updates hash of board and pushes the move on the move stack.
+        :param position: Position on board which should be occupied.
+        :param player_marker: Determines player (X or O).
+        :return: None
+        """
+        # Board is only changed after position is checked, so a wrong move cannot corrupt bitboards or hash.
+        if isinstance(position, bool) or not 0 <= position < self.__width * self.__height:
+            raise ValueError(f"Position {position} is not on board.")
+        bit = 1 << position
+        if (self.__cross | self.__circle) & bit:
+            raise ValueError(f"Position {position} is occupied.")
+        if player_marker == PlayerMarker.Cross:
+            self.__move_stack.append((position, player_marker, self.__cross_won))
+            self.__cross |= bit
+            self.__hash ^= self.__zobrist_keys[0][position]
+            if not self.__cross_won:
+                self.__cross_won = self.makes_row(self.__cross, position)
+        elif player_marker == PlayerMarker.Circle:
+            self.__move_stack.append((position, player_marker, self.__circle_won))
+            self.__circle |= bit
+            self.__hash ^= self.__zobrist_keys[1][position]
+            if not self.__circle_won:
+                self.__circle_won = self.makes_row(self.__circle, position)
+        else:
+            raise ValueError("Marker of player is not specified.")
+
+    def unmake_move(self) -> int:
+        """
+        Takes back the last move on the move stack and restores board (including its hash) to the position before it.
+        :return: Position of the move which was taken back.
+        """
+        if not self.__move_stack:
+            raise ValueError("There is no move to take back.")
+        position, player_marker, had_won = self.__move_stack.pop()
+        if player_marker == PlayerMarker.Cross:
+            self.__cross &= ~(1 << position)
+            self.__cross_won = had_won
+            self.__hash ^= self.__zobrist_keys[0][position]
+        else:
+            self.__circle &= ~(1 << position)
+            self.__circle_won = had_won
+            self.__hash ^= self.__zobrist_keys[1][position]
+        return position
+
+    def makes_row(self, selected: int, position: int) -> bool:
+        """
+        Checks only the four directions through position to find a row of win_length markers.
+        Also used by search strategies to check bitboards which are not stored on board.
+        :param selected: Bitboard of the player who placed a marker on position.
+        :param position: Position of the last placed marker.
+        :return: True if the marker completes a row.
+        """
+        width, height = self.__width, self.__height
+        row, column = divmod(position, width)
+        for row_step, column_step in Board.directions:
+            count = 1
+            for sign in (1, -1):
+                r, c = row + sign * row_step, column + sign * column_step
+                while 0 <= r < height and 0 <= c < width and selected >> (r * width + c) & 1:
+                    count += 1
+                    r += sign * row_step
+                    c += sign * column_step
+            if count >= self.__win_length:
+                return True
+        return False
+
+    def check_winner(self, player_marker: PlayerMarker) -> bool:
+        """
+        Due to player's moves, checks that if player can win or not.
+        :param player_marker: A Player object.
+        :return: Return True if player won the game.
+        """
+        if player_marker == PlayerMarker.Cross:
+            return self.__cross_won
+        if player_marker == PlayerMarker.Circle:
+            return self.__circle_won
+        return False
+
+    def get_winning_line(self, player_marker: PlayerMarker) -> tuple | None:
+        """
+        Gets positions of a row which made player winner.
+        :param player_marker: Determines player (X or O).
+        :return: Positions of the row. It returns None when player has not won.
+        """
+        if not self.check_winner(player_marker):
+            return None
+        selected = self.bitboard(player_marker)
+        for case in Board.get_wining_cases(self.__width, self.__height, self.__win_length):
+            if all(selected >> i & 1 for i in case):
+                return case
+        return None
+
+    def get_selected_places(self, player_marker: PlayerMarker) -> list:
+        """
+        Gets the places that player selected.
+        :param player_marker: A Player object
+        :return: List of player's selected places
+        """
+        selected = self.bitboard(player_marker)
+        return [i for i in range(self.__width * self.__height) if selected >> i & 1]
+
+    def check_unoccupied_places(self, *places) -> list:
+        """
+        Checks if places are occupied or not then return those one that are unoccupied.
+        This function returns [] when there is no empty place among places param on board.
+        :param places: Positions of board that are wanted to check.
+        :return: List of unoccupied places
+        """
+        occupied = self.__cross | self.__circle
+        return [c for c in places if not occupied >> c & 1]
+
+    def get_winning_move(self, player_marker: PlayerMarker) -> int | None:
+        """
+        Gets a move that can make player (Computer or User) winner
+        :param player_marker: Determines player (X or O).
+        :return: Position number that can make player winner of game.
+        It returns None when there is no way to win.
+        """
+        selected = self.bitboard(player_marker)
+        occupied = self.__cross | self.__circle
+        # A move is winning when player has all positions of a wining case except one and that one is empty.
+        for rest, remaining in Board.get_completing_masks(self.__width, self.__height, self.__win_length):
+            if selected & rest == rest and not occupied & remaining:
+                return remaining.bit_length() - 1
+        return None
+
+
+class Player:
+    """
+    Determines Player model and its common properties.
+    """
+
+    def __init__(self, marker: PlayerMarker = PlayerMarker.Unspecified):
+        self.__marker = marker
+
+    # Determines the marker that Player uses in the process of Game.
+    @property
+    def marker(self):
+        return self.__marker
+
+    @marker.setter
+    def marker(self, marker: PlayerMarker):
+        self.__marker = marker
+
+
+class UserPlayer(Player):
+    """
+    Determines User Player model.
+    This class inherits from Player class.
+    """
+    pass
+
+
+class Strategy:
+    """
+    Determines interface of the strategies that ComputerPlayer uses to choose its moves.
+    Subclasses only choose a move; they should not change the board.
+    """
+    name = "strategy"  # Name of strategy in reports.
+
+    def choose_move(self, board: Board, player_marker: PlayerMarker) -> int | None:
+        """
+        Chooses a move for player.
+        :param board: Current board of the game.
+        :param player_marker: Determines player (X or O) who should move.
+        :return: Selected position on board. It returns None when there is no move.
+        """
+        raise NotImplementedError
+
+
+class RuleBasedStrategy(Strategy):
+    """
+    Determines default strategy of ComputerPlayer.
+    Wins if it can, otherwise blocks the winning move of opponent, otherwise selects randomly a corner, then a center
+    and then any other position.
+    """
+    name = "rules"
+
+    def choose_move(self, board: Board, player_marker: PlayerMarker) -> int | None:
+        position = board.get_winning_move(player_marker)
+        if position is None:
+            position = board.get_winning_move(player_marker.opponent)
+        if position is not None:
+            return position
+        for places in (board.corners, board.centers, board.places):
+            unoccupied_places = board.check_unoccupied_places(*places)
+            if unoccupied_places:
+                return random.choice(unoccupied_places)
+        return None
+
+
+class RandomStrategy(Strategy):
+    """
+    Determines a strategy which selects randomly one of the unoccupied positions.
+    """
+    name = "random"
+
+    def choose_move(self, board: Board, player_marker: PlayerMarker) -> int | None:
+        unoccupied_places = board.check_unoccupied_places(*board.places)
+        return random.choice(unoccupied_places) if unoccupied_places else None
+
+
+class ComputerPlayer(Player):
+    """
+    Determines Computer Player model.
+    This class inherits from Player class.
+    """
+
+    def __init__(self, marker: PlayerMarker = PlayerMarker.Unspecified, strategy: Strategy | None = None,
+                 instrumentation=None):
+        """
+        Initializes ComputerPlayer class.
+        :param marker: Determines the marker that Player uses in the process of Game.
+        :param strategy: The Strategy which computer delegates choosing its moves to.
+        RuleBasedStrategy is used when it is None.
+        :param instrumentation: An Instrumentation object which latency of moves is recorded in.
+        """
+        super().__init__(marker)
+        self.__strategy = strategy if strategy is not None else RuleBasedStrategy()
+        self.__instrumentation = instrumentation
+
+    # Determines the strategy that computer uses to choose its moves.
+    @property
+    def strategy(self) -> Strategy:
+        return self.__strategy
+
+    @strategy.setter
+    def strategy(self, strategy: Strategy):
+        self.__strategy = strategy
+
+    def make_a_move(self, board: Board) -> int | None:
+        """
+        Makes a move for computer due to scenario of the game.
+        :return: selected position on board by computer
+        """
+        if self.__instrumentation is None:
+            return self.__make_a_move(board)
+        move_profiler = self.__instrumentation.move_profiler
+        if move_profiler is not None:
+            move_profiler.enable()
+        start = time.perf_counter()
+        try:
+            position = self.__make_a_move(board)
+        finally:
+            if move_profiler is not None:
+                move_profiler.disable()
+        self.__instrumentation.record("make_a_move", time.perf_counter() - start)
+        return position
+
+    def __make_a_move(self, board: Board) -> int | None:
+        position = self.__strategy.choose_move(board, self.marker)
+        if position is not None:
+            board.make_move(position, self.marker)
+        return position
+
+
+class GameEngine:
+    """
+    Headless model of a Game which handles board, turn order and outcome without any user interface.
+    Moves can be taken back with undo and made again with redo until a new move is made.
+    Used by Game (tkinter) and by self-play of computer players.
+    """
+
+    def __init__(self, first_player: Player, second_player: Player, width: int = 3, height: int = 3,
+                 win_length: int = 3):
+        """
+        Initializes GameEngine class.
+        Markers of players can be specified later, but before the first move.
+        :param first_player: Player who makes the first move.
+        :param second_player: Player who makes the second move.
+        :param width: Number of columns of board.
+        :param height: Number of rows of board.
+        :param win_length: Number of markers in a row which are needed to win the game.
+        """
+        self.__board = Board(width, height, win_length)
+        self.__players = (first_player, second_player)
+        self.__turn = 0  # Number of moves which were made so far.
+        self.__winner = None
+        self.__moves = []
+        self.__undone_moves = []  # Moves which were taken back, the last one is made first by redo.
+
+    def reset(self, first_player: Player, second_player: Player) -> None:
+        """
+        Clears board and starts a new game with the same board size.
+        :param first_player: Player who makes the first move.
+        :param second_player: Player who makes the second move.
+        :return: None
+        """
+        self.__board.clear()
+        self.__players = (first_player, second_player)
+        self.__turn = 0
+        self.__winner = None
+        self.__moves = []
+        self.__undone_moves = []
+
+    # Determines board of the game.
+    @property
+    def board(self) -> Board:
+        return self.__board
+
+    # Determines players of the game in order of their turns.
+    @property
+    def players(self) -> tuple:
+        return self.__players
+
+    # Determines the player who should make the next move.
+    @property
+    def current_player(self) -> Player:
+        return self.__players[self.__turn % 2]
+
+    # Determines number of moves which were made so far.
+    @property
+    def turn(self) -> int:
+        return self.__turn
+
+    # Determines positions of the moves which were made so far, in order.
+    @property
+    def moves(self) -> tuple:
+        return tuple(self.__moves)
+
+    # Determines the player who won the game. It is None while nobody won.
+    @property
+    def winner(self) -> Player | None:
+        return self.__winner
+
+    # Determines that if game is finished (a player won or the game ended in tie).
+    @property
+    def is_finished(self) -> bool:
+        return self.__winner is not None or self.__board.is_full
+
+    # Determines that if there is a move which can be taken back.
+    @property
+    def can_undo(self) -> bool:
+        return bool(self.__moves)
+
+    # Determines that if there is a taken back move which can be made again.
+    @property
+    def can_redo(self) -> bool:
+        return bool(self.__undone_moves)
+
+    def make_move(self, position: int) -> None:
+        """
+        Places marker of current player on position and passes the turn.
+        Moves which were taken back cannot be made again by redo after that.
+        :param position: Position on board which current player selected.
+        :return: None
+        """
+        self.__make_move(position)
+        self.__undone_moves.clear()
+
+    def __make_move(self, position: int) -> None:
+        if self.is_finished:
+            raise ValueError("Game is finished.")
+        player = self.current_player
+        self.__board.make_move(position, player.marker)
+        self.__end_turn(player, position)
+
+    def undo(self) -> int:
+        """
+        Takes back the last move and gives the turn back to the player who made it.
+        :return: Position of the move which was taken back.
+        """
+        if not self.__moves:
+            raise ValueError("There is no move to take back.")
+        position = self.__board.unmake_move()
+        self.__moves.pop()
+        self.__turn -= 1
+        self.__winner = None  # Game is finished by the first win, so nobody has won before the last move.
+        self.__undone_moves.append(position)
+        return position
+
+    def redo(self) -> int:
+        """
+        Makes the last move which was taken back again.
+        :return: Position of the move.
+        """
+        if not self.__undone_moves:
+            raise ValueError("There is no move to make again.")
+        position = self.__undone_moves[-1]
+        self.__make_move(position)
+        self.__undone_moves.pop()
+        return position
+
+    def play_computer_move(self) -> int | None:
+        """
+        Makes a move for current player which should be a ComputerPlayer.
+        :return: Selected position on board by computer.
+        """
+        player = self.current_player
+        if not isinstance(player, ComputerPlayer):
+            raise TypeError("Current player is not a ComputerPlayer.")
+        if self.is_finished:
+            return None
+        position = player.make_a_move(self.__board)
+        if position is not None:
+            self.__end_turn(player, position)
+            self.__undone_moves.clear()
+        return position
+
+    def play(self) -> Player | None:
+        """
+        Plays the game until it is finished. Both players should be ComputerPlayer.
+        :return: The player who won the game. It returns None when the game ended in tie.
+        """
+        while not self.is_finished:
+            if self.play_computer_move() is None:
+                raise RuntimeError("Computer could not make a move.")
+        return self.__winner
+
+    def __end_turn(self, player: Player, position: int) -> None:
+        # Checks result of the move and passes the turn to the other player.
+        self.__moves.append(position)
+        if self.__board.check_winner(player.marker):
+            self.__winner = player
+        self.__turn += 1
@@ -1,277 +1,304 @@
+from Models.CoreModels import *
 from Models.TkinterModels import *
+from Models.RecordModels import *
+from Models.WorkerModels import *
+import logging
 import random
+import time
 
+logger = logging.getLogger(__name__)
 
-class Board:
+
+class Game:
     """
-    Determines Board model.
+    Composition of main entities and handles the logic of Game.
+    Moves of computer are chosen by a MoveWorker on a background thread; the event loop of tkinter polls for them,
+    so the window stays responsive however long the strategy takes. When strategy is a PonderingStrategy, computer
+    searches its replies on the turns of user too.
     """
-    wining_cases = [[0, 1, 2], [3, 4, 5], [6, 7, 8],  # Horizontal cases
-                    [0, 3, 6], [1, 4, 7], [2, 5, 8],  # Vertical cases
-                    [0, 4, 8], [2, 4, 6]]  # Diagonal cases
+    poll_interval = 20  # Milliseconds between checks for the move of computer.
 
-    def __init__(self):
-        # Create Default Board
-        self.__board = {}
-        for a in range(0, 9):
-            self.__board[a] = str(a)
-
-    def update_board(self, x=None, o=None) -> None:
+    def __init__(self, main_layout: MainLayout, width: int = 3, height: int = 3, win_length: int = 3,
+                 instrumentation=None, recorder=None, canvas: bool | None = None, strategy: Strategy | None = None):
         """
-        Makes changes on board dictionary according to values of x and o params.
-        :param x: Position of X on board
-        :param o: Position of O on board
-        :return: None
+        Initializes Game class.
+        :param main_layout: tkinter root window.
+        :param width: Number of columns of board.
+        :param height: Number of rows of board.
+        :param win_length: Number of markers in a row which are needed to win the game.
+        :param instrumentation: An Instrumentation object which collects counters and latencies of the game.
+        Nothing is measured when it is None.
+        :param recorder: A GameRecordWriter which the game is recorded in when it is finished.
+        :param canvas: Determines that if board is drawn on a GameBoardCanvas instead of a button per position.
+        Canvas is used for boards bigger than 3x3 when it is None.
+        :param strategy: The Strategy of computer. RuleBasedStrategy is used when it is None.
         """
-        if x is not None:
-            self.__board[x] = "X"
-        if o is not None:
-            self.__board[o] = "O"
+        # Determines randomly whether the computer or the player goes first.
+        self.__starter_player = random.choice([0, 1])  # 0 => User, 1 => Computer
+        self.__user_player = UserPlayer()
+        self.__instrumentation = instrumentation
+        self.__recorder = recorder
+        self.__computer_player = ComputerPlayer(strategy=strategy, instrumentation=instrumentation)
+        self.__worker = MoveWorker()
+        self.__poll_id = None  # Id of the scheduled check for the move of computer.
+        self.__click_time = None  # Time of the click which computer is responding to.
+        self.__recorded = False  # Result of the game was recorded; redoing into the end does not record it again.
+        if self.__starter_player == 1:
+            self.__engine = GameEngine(self.__computer_player, self.__user_player, width, height, win_length)
+        else:
+            self.__engine = GameEngine(self.__user_player, self.__computer_player, width, height, win_length)
+        self.__main_layout = main_layout
+        if canvas is None:
+            canvas = width * height > 9
+        board_frame_class = GameBoardCanvas if canvas else GameBoardFrame
+        self.__game_board_frame = board_frame_class(self.__main_layout, width, height, on_click=self.__on_board_click)
+        self.__marker_determiner_frame = MarkerDeterminerFrame(self.__main_layout, on_click=self.__on_marker_selected)
+        self.__game_status_frame = GameStatusFrame(self.__main_layout, on_play_again=self.reset, on_undo=self.undo,
+                                                   on_redo=self.redo)
+        self.__status = GameStatus.Starting  # Frames are created in starting state too.
+        self.__main_layout.protocol("WM_DELETE_WINDOW", self.close)
+
+    # Determines status of the game.
+    # Status is kept up to date by __update_status whenever a move is made, so reading it does not compute anything.
+    @property
+    def status(self):
+        return self.__status
+
+    def __update_status(self) -> None:
+        # Computes status after a change in the game and notifies frames only when status changed.
+        if self.__instrumentation is not None:
+            self.__instrumentation.count("status_evaluations")
+        if self.__user_player.marker == PlayerMarker.Unspecified:
+            status = GameStatus.Starting
+        elif self.__engine.winner is self.__user_player:
+            status = GameStatus.UserWon
+        elif self.__engine.winner is self.__computer_player:
+            status = GameStatus.ComputerWon
+        # if there is no unoccupied position on board, the game ends in tie
+        elif self.__engine.is_finished:
+            status = GameStatus.Tie
+        else:
+            status = GameStatus.InProgress
+        if status != self.__status:
+            self.__status = status
+            self.__game_status_frame.status = status
+            self.__game_board_frame.status = status
+            if self.__engine.winner is not None:
+                self.__game_board_frame.highlight(self.__engine.board.get_winning_line(self.__engine.winner.marker))
+        self.__game_status_frame.set_history(self.can_undo, self.can_redo)
+
+    # Determines that if user can take back its last move. Moves of computer after it are taken back too.
+    @property
+    def can_undo(self) -> bool:
+        # Computer started the game when starter player is 1, so its first move is not taken back alone.
+        return self.__status != GameStatus.Starting and not self.__worker.is_busy and \
+            self.__engine.turn > self.__starter_player
 
-    def check_winner(self, player_marker: PlayerMarker) -> bool:
+    # Determines that if there is a taken back move of user which can be made again.
+    @property
+    def can_redo(self) -> bool:
+        return self.__status != GameStatus.Starting and not self.__worker.is_busy and self.__engine.can_redo
+
+    def play(self) -> None:
         """
-        Due to player's moves, checks that if player can win or not.
-        :param player_marker: A Player object.
-        :return: Return True if player won the game.
+        Starts the game.
+        The game is driven by click callbacks of the frames, so nothing runs while user is idle.
+        :return: None
         """
-        selected = self.get_selected_places(player_marker)
-        # Check that if player can win the game.
-        for case in Board.wining_cases:
-            if set(case).intersection(set(selected)) == set(case):
-                return True
-        return False
+        self.__update_status()
 
-    def get_selected_places(self, player_marker: PlayerMarker) -> list:
+    def reset(self) -> None:
         """
-        Gets the places that player selected.
-        :param player_marker: A Player object
-        :return: List of player's selected places
+        Starts a new game in the same window, reusing board, players and all frames.
+        :return: None
         """
-        selected = []
-        # Fetch position numbers that player selected so far in the game and then put them into selected list.
-        for i in self.__board:
-            if self.__board[i] == player_marker.value:
-                selected.append(i)
-        return selected
+        self.__cancel_computer_move()
+        self.__recorded = False
+        # Determines randomly whether the computer or the player goes first.
+        self.__starter_player = random.choice([0, 1])  # 0 => User, 1 => Computer
+        if self.__starter_player == 1:
+            self.__engine.reset(self.__computer_player, self.__user_player)
+        else:
+            self.__engine.reset(self.__user_player, self.__computer_player)
+        self.__user_player.marker = PlayerMarker.Unspecified
+        self.__computer_player.marker = PlayerMarker.Unspecified
+        self.__game_status_frame.user_marker = PlayerMarker.Unspecified
+        self.__game_status_frame.computer_marker = PlayerMarker.Unspecified
+        self.__game_board_frame.reset()
+        self.__update_status()
+        self.__marker_determiner_frame.show()
 
-    def check_unoccupied_places(self, *places) -> list:
+    def close(self) -> None:
         """
-        Checks if places are occupied or not then return those one that are unoccupied.
-        This function returns [] when there is no empty place among places param on board.
-        :param places: Positions of board that are wanted to check.
-        :return: List of unoccupied places
+        Stops computing the move of computer and closes the window.
+        :return: None
         """
-        unoccupied_places = []
-        for c in places:
-            if self.__board[c] == str(c):
-                unoccupied_places.append(c)
-        return unoccupied_places
+        self.__cancel_computer_move()
+        self.__worker.close()
+        self.__main_layout.destroy()
 
-    def get_winning_move(self, player_marker: PlayerMarker) -> int | None:
+    def undo(self) -> None:
         """
-        Gets a move that can make player (Computer or User) winner
-        :param player_marker: Determines player (X or O).
-        :return: Position number that can make player winner of game.
-        It returns None when there is no way to win.
+        Takes back the last move of user and the moves of computer after it, so it is user's turn again.
+        :return: None
         """
-        winning_moves = []
-        selected = self.get_selected_places(player_marker)
-        lt = []  # List of every two elements (as tuple) of selected list.
-        # Find cases of every two elements of selected list.
-        # Ex) selected = [1,2,3] => lt = [(1,2),(1,3),(2,3)]
-        for j in selected:
-            k = 1
-            while selected.index(j) + k <= len(selected) - 1:
-                lt.append((j, selected[selected.index(j) + k]))
-                k += 1
-        # Get winning move due to all win cases.
-        for case in Board.wining_cases:
-            for i in lt:
-                if set(case).intersection(set(i)) == set(i):
-                    winning_moves.append(list(set(case).difference(set(i)))[0])
-        for i in winning_moves:
-            if self.check_unoccupied_places(i):
-                return i
-        return None
-
-
-class Player:
-    """
-    Determines Player model and its common properties.
-    """
-
-    def __init__(self, marker: PlayerMarker = PlayerMarker.Unspecified):
-        self.__marker = marker
-
-    # Determines the marker that Player uses in the process of Game.
-    @property
-    def marker(self):
-        return self.__marker
-
-    @marker.setter
-    def marker(self, marker: PlayerMarker):
-        self.__marker = marker
+        if not self.can_undo:
+            return
+        while True:
+            self.__game_board_frame.remove_marker(self.__engine.undo())
+            if self.__engine.current_player is self.__user_player:
+                break
+        self.__game_board_frame.locked = False  # Board was locked if computer could not choose its move.
+        self.__update_status()
+        self.__ponder()
 
-
-class UserPlayer(Player):
-    """
-    Determines User Player model.
-    This class inherits from Player class.
-    """
-    pass
-
-
-class ComputerPlayer(Player):
-    """
-    Determines Computer Player model.
-    This class inherits from Player class.
-    """
-
-    def make_a_move(self, board: Board) -> int | None:
+    def redo(self) -> None:
         """
-        Makes a move for computer due to scenario of the game.
-        :return: selected position on board by computer
+        Makes the taken back moves again until it is user's turn or game is finished.
+        :return: None
         """
-        position = None
-        if self.marker == PlayerMarker.Circle:
-            if board.get_winning_move(PlayerMarker.Circle) is not None and board.check_unoccupied_places(
-                    board.get_winning_move(PlayerMarker.Circle)):
-                position = board.get_winning_move(PlayerMarker.Circle)
-                board.update_board(o=position)
-            elif board.get_winning_move(PlayerMarker.Cross) is not None and board.check_unoccupied_places(
-                    board.get_winning_move(PlayerMarker.Cross)):
-                position = board.get_winning_move(PlayerMarker.Cross)
-                board.update_board(o=position)
-            elif board.check_unoccupied_places(0, 2, 6, 8):
-                position = random.choice(board.check_unoccupied_places(0, 2, 6, 8))
-                board.update_board(o=position)
-            elif board.check_unoccupied_places(4):
-                position = random.choice(board.check_unoccupied_places(4))
-                board.update_board(o=position)
-            elif board.check_unoccupied_places(1, 3, 5, 7):
-                position = random.choice(board.check_unoccupied_places(1, 3, 5, 7))
-                board.update_board(o=position)
-        elif self.marker == PlayerMarker.Cross:
-            if board.get_winning_move(PlayerMarker.Cross) is not None and board.check_unoccupied_places(
-                    board.get_winning_move(PlayerMarker.Cross)):
-                position = board.get_winning_move(PlayerMarker.Cross)
-                board.update_board(x=position)
-            elif board.get_winning_move(PlayerMarker.Circle) is not None and board.check_unoccupied_places(
-                    board.get_winning_move(PlayerMarker.Circle)):
-                position = board.get_winning_move(PlayerMarker.Circle)
-                board.update_board(x=position)
-            elif board.check_unoccupied_places(0, 2, 6, 8):
-                position = random.choice(board.check_unoccupied_places(0, 2, 6, 8))
-                board.update_board(x=position)
-            elif board.check_unoccupied_places(4):
-                position = random.choice(board.check_unoccupied_places(4))
-                board.update_board(x=position)
-            elif board.check_unoccupied_places(1, 3, 5, 7):
-                position = random.choice(board.check_unoccupied_places(1, 3, 5, 7))
-                board.update_board(x=position)
+        if not self.can_redo:
+            return
+        while self.__engine.can_redo:
+            player = self.__engine.current_player
+            self.__game_board_frame.insert_marker(self.__engine.redo(), player.marker)
+            if self.__engine.is_finished or self.__engine.current_player is self.__user_player:
+                break
+        self.__update_status()
+        if self.status == GameStatus.InProgress and self.__engine.current_player is self.__computer_player:
+            # Only the move of user was taken back before (e.g. computer could not choose its reply), so computer
+            # should choose its reply again.
+            self.__start_computer_move()
+            return
+        self.__ponder()
+        self.__show_result()
 
-        return position
+    def __on_marker_selected(self, marker: PlayerMarker) -> None:
+        # Callback of MarkerDeterminerFrame which is called when user chose its marker.
+        if self.__user_player.marker != PlayerMarker.Unspecified:
+            return
+        self.__game_board_frame.marker = marker
+        if marker == PlayerMarker.Cross:
+            self.__user_player.marker = PlayerMarker.Cross
+            self.__computer_player.marker = PlayerMarker.Circle
+        else:
+            self.__user_player.marker = PlayerMarker.Circle
+            self.__computer_player.marker = PlayerMarker.Cross
+        self.__game_status_frame.user_marker = self.__user_player.marker
+        self.__game_status_frame.computer_marker = self.__computer_player.marker
+        self.__marker_determiner_frame.hide()
+        if self.__instrumentation is not None:
+            self.__instrumentation.start_game()
+        self.__update_status()
+        if self.status == GameStatus.InProgress:
+            if self.__engine.current_player is self.__computer_player:
+                self.__start_computer_move()
+            else:
+                self.__ponder()
+                MainLayout.show_info("It's your turn!")
 
+    def __on_board_click(self, button_number: int) -> None:
+        # Callback of GameBoardFrame which is called when user made a move.
+        # Makes next move for computer, just after that user made a move.
+        if self.status != GameStatus.InProgress:
+            return
+        if self.__instrumentation is not None:
+            self.__instrumentation.count("board_clicks")
+            self.__click_time = time.perf_counter()
+        # Updates board according to the position which user selected.
+        self.__engine.make_move(button_number)
+        self.__update_status()
+        self.__game_board_frame.last_clicked_button = None
+        if self.status == GameStatus.InProgress:
+            self.__start_computer_move()
+            return
+        self.__record_response()
+        self.__show_result()
 
-class Game:
-    """
-    Composition of main entities and handles the logic of Game.
-    """
+    def __start_computer_move(self) -> None:
+        # Asks MoveWorker for the move of computer and blocks input of user until it arrives.
+        self.__game_board_frame.locked = True
+        self.__game_status_frame.thinking = True
+        self.__worker.request(self.__computer_player, self.__engine.board)
+        self.__game_status_frame.set_history(False, False)
+        self.__poll_id = self.__main_layout.after(Game.poll_interval, self.__poll_computer_move)
 
-    def __init__(self, main_layout: MainLayout):
-        # Determines randomly whether the computer or the player goes first.
-        self.__starter_player = random.choice([0, 1])  # 0 => User, 1 => Computer
-        self.__board = Board()
-        self.__user_player = UserPlayer()
-        self.__computer_player = ComputerPlayer()
-        self.__main_layout = main_layout
-        self.__game_board_frame = GameBoardFrame(self.__main_layout)
-        self.__marker_determiner_frame = MarkerDeterminerFrame(self.__main_layout)
-        self.__game_status_frame = GameStatusFrame(self.__main_layout)
-        self.__identifier_of_infinite_loop = None
+    def __poll_computer_move(self) -> None:
+        # Called by event loop of tkinter until the move of computer is ready, then makes it on board.
+        self.__poll_id = None
+        if self.__instrumentation is not None:
+            self.__instrumentation.count("poll_ticks")
+        try:
+            result = self.__worker.poll()
+        except Exception:
+            logger.exception("strategy of computer failed")
+            self.__fail_computer_move()
+            return
+        if result is None:
+            if self.__worker.is_busy:
+                self.__poll_id = self.__main_layout.after(Game.poll_interval, self.__poll_computer_move)
+            return
+        position = result[1]
+        if position is None:
+            self.__fail_computer_move()
+            return
+        self.__stop_thinking()
+        self.__engine.make_move(position)
+        self.__game_board_frame.insert_marker(position, self.__computer_player.marker)
+        self.__update_status()
+        self.__record_response()
+        self.__ponder()
+        if self.__engine.turn == 1:
+            MainLayout.show_info("Computer did it's move. Now it's your turn.")
+        self.__show_result()
 
-    # Determines status of the game.
-    @property
-    def status(self):
-        if self.__user_player.marker != PlayerMarker.Unspecified:
-            if self.__board.check_winner(self.__user_player.marker):
-                self.__game_status_frame.status = GameStatus.UserWon
-                self.__game_board_frame.status = GameStatus.UserWon
-                return GameStatus.UserWon
-            elif self.__board.check_winner(self.__computer_player.marker):
-                self.__game_status_frame.status = GameStatus.ComputerWon
-                self.__game_board_frame.status = GameStatus.ComputerWon
-                return GameStatus.ComputerWon
-            # if check_unoccupied_places return [] for all positions on board, the game ends in tie
-            elif not self.__board.check_unoccupied_places(0, 1, 2, 3, 4, 5, 6, 7, 8):
+    def __ponder(self) -> None:
+        # Lets computer search its replies while user is thinking.
+        if self.status == GameStatus.InProgress and self.__engine.current_player is self.__user_player:
+            self.__worker.ponder(self.__computer_player, self.__engine.board)
 
-                self.__game_status_frame.status = GameStatus.Tie
-                self.__game_board_frame.status = GameStatus.Tie
-                return GameStatus.Tie
-            else:
-                self.__game_status_frame.status = GameStatus.InProgress
-                self.__game_board_frame.status = GameStatus.InProgress
-                return GameStatus.InProgress
-        else:
-            self.__game_status_frame.status = GameStatus.Starting
-            self.__game_board_frame.status = GameStatus.Starting
-            return GameStatus.Starting
+    def __stop_thinking(self) -> None:
+        # Unblocks input of user and hides the thinking indicator.
+        if self.__poll_id is not None:
+            self.__main_layout.after_cancel(self.__poll_id)
+            self.__poll_id = None
+        self.__game_board_frame.locked = False
+        self.__game_status_frame.thinking = False
+        self.__game_status_frame.set_history(self.can_undo, self.can_redo)
 
-    def play(self) -> None:
-        if self.status == GameStatus.Starting:
-            self.__specify_selected_marker()
-            self.__identifier_of_infinite_loop = self.__game_board_frame.after(1, self.play)
-        elif self.status == GameStatus.InProgress:
-            self.__game_board_frame.after_cancel(self.__identifier_of_infinite_loop)
-            if self.__starter_player == 1:
-                position = self.__computer_player.make_a_move(self.__board)
-                if position is not None:
-                    self.__game_board_frame.insert_marker(position, self.__computer_player.marker)
-                    MainLayout.show_info("Computer did it's move. Now it's your turn.")
-            else:
-                MainLayout.show_info("It's your turn!")
-            self.__make_next_move()
+    def __fail_computer_move(self) -> None:
+        # Engine still waits for the move of computer, so board stays locked until user takes back its move or
+        # plays again; otherwise the next click would be made as the move of computer.
+        self.__stop_thinking()
+        self.__game_board_frame.locked = True
+        MainLayout.show_warning("Computer could not choose a move. Undo your move or play again.")
 
-    def __specify_selected_marker(self) -> None:
-        # Defines an infinite loop to check if user marker is chosen or not.
-        # Infinite loop will be canceled when user chose its marker.
-        self.__identifier_of_infinite_loop = self.__marker_determiner_frame.after(1, self.__specify_selected_marker)
-        if self.__marker_determiner_frame.selected_marker is not None and self.__user_player.marker == PlayerMarker.Unspecified:
-            self.__game_board_frame.marker = self.__marker_determiner_frame.selected_marker
-            if self.__marker_determiner_frame.selected_marker == PlayerMarker.Cross:
-                self.__user_player.marker = PlayerMarker.Cross
-                self.__computer_player.marker = PlayerMarker.Circle
-            else:
-                self.__user_player.marker = PlayerMarker.Circle
-                self.__computer_player.marker = PlayerMarker.Cross
-            self.__game_status_frame.user_marker = self.__user_player.marker
-            self.__game_status_frame.computer_marker = self.__computer_player.marker
-            # Cancels the infinite loop.
-            self.__marker_determiner_frame.after_cancel(self.__identifier_of_infinite_loop)
-            self.__marker_determiner_frame.destroy()
+    def __cancel_computer_move(self) -> None:
+        # Drops the move of computer which is being computed (e.g. when game is reset), and stops pondering.
+        if self.__worker.is_busy:
+            self.__stop_thinking()
+        self.__worker.cancel()
+        self.__click_time = None
 
-    def __make_next_move(self) -> None:
-        # Defines an infinite loop to make a move for computer, just after that user made a move (make next move for computer).
-        # Infinite loop will be canceled when game is finished.
-        self.__identifier_of_infinite_loop = self.__game_board_frame.after(1, self.__make_next_move)
-        if self.status == GameStatus.InProgress:
-            if self.__game_board_frame.last_clicked_button is not None:
-                if self.__user_player.marker == PlayerMarker.Cross:
-                    # Updates board dictionary according to the position which user selected. 
-                    self.__board.update_board(x=self.__game_board_frame.last_clicked_button)
-                else:
-                    # Updates board dictionary according to the position which user selected. 
-                    self.__board.update_board(o=self.__game_board_frame.last_clicked_button)
-                if not self.__board.check_winner(self.__user_player.marker):
-                    position = self.__computer_player.make_a_move(self.__board)
-                    self.__game_board_frame.insert_marker(position, self.__computer_player.marker)
-                    self.__game_board_frame.last_clicked_button = None
-        else:
-            # Cancels the infinite loop.
-            self.__game_board_frame.after_cancel(self.__identifier_of_infinite_loop)
-            if self.status == GameStatus.UserWon:
-                MainLayout.show_info("You won!")
-            elif self.status == GameStatus.ComputerWon:
-                MainLayout.show_info("Computer won!")
-            elif self.status == GameStatus.Tie:
-                MainLayout.show_info("Tie!")
+    def __record_response(self) -> None:
+        # Records time from click of user until the game was ready for the next click.
+        if self.__instrumentation is not None and self.__click_time is not None:
+            self.__instrumentation.record("click_to_response", time.perf_counter() - self.__click_time)
+        self.__click_time = None
+
+    def __show_result(self) -> None:
+        # Shows result of the game when game is finished. Result is recorded only when game is finished first time.
+        status = self.status
+        if not self.__recorded and status not in (GameStatus.Starting, GameStatus.InProgress):
+            self.__recorded = True
+            if self.__instrumentation is not None:
+                self.__instrumentation.finish_game(status.name)
+            if self.__recorder is not None:
+                self.__recorder.write(GameRecord(self.__engine.moves, self.__starter_player == 1,
+                                                 self.__user_player.marker, status))
+        if status == GameStatus.UserWon:
+            MainLayout.show_info("You won!")
+        elif status == GameStatus.ComputerWon:
+            MainLayout.show_info("Computer won!")
+        elif status == GameStatus.Tie:
+            MainLayout.show_info("Tie!")
@@ -11,6 +11,15 @@ class PlayerMarker(Enum):
     Circle = "O"
     Unspecified = None
 
+    # Determines marker of the other player.
+    @property
+    def opponent(self):
+        if self == PlayerMarker.Cross:
+            return PlayerMarker.Circle
+        if self == PlayerMarker.Circle:
+            return PlayerMarker.Cross
+        return PlayerMarker.Unspecified
+
 
 class GameStatus(Enum):
     """
@@ -0,0 +1,164 @@
+import json
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """
+    Determines a histogram of latencies with power-of-two buckets of microseconds.
+    Bucket i holds latencies in [2 ** (i - 1), 2 ** i) microseconds, so recording a value is a few integer operations.
+    """
+
+    def __init__(self):
+        self.__buckets = [0] * 40
+        self.__count = 0
+        self.__total = 0.0
+        self.__min = None
+        self.__max = 0.0
+
+    # Determines number of recorded latencies.
+    @property
+    def count(self) -> int:
+        return self.__count
+
+    def record(self, seconds: float) -> None:
+        """
+        Adds a latency to histogram.
+        :param seconds: Latency in seconds.
+        :return: None
+        """
+        self.__buckets[min(int(seconds * 1e6).bit_length(), 39)] += 1
+        self.__count += 1
+        self.__total += seconds
+        if self.__min is None or seconds < self.__min:
+            self.__min = seconds
+        if seconds > self.__max:
+            self.__max = seconds
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimates a percentile as the upper bound of the bucket which contains it.
+        :param fraction: Percentile as a fraction (0.99 => p99).
+        :return: Latency in seconds. It returns 0 when histogram is empty.
+        """
+        if not self.__count:
+            return 0.0
+        rank = fraction * self.__count
+        seen = 0
+        for i, count in enumerate(self.__buckets):
+            seen += count
+            if seen >= rank and count:
+                return min((1 << i) / 1e6, self.__max)
+        return self.__max
+
+    def summary(self) -> dict:
+        """
+        Gets summary of histogram. Times are in milliseconds.
+        """
+        if not self.__count:
+            return {"count": 0}
+        return {"count": self.__count,
+                "mean_ms": self.__total / self.__count * 1e3,
+                "min_ms": self.__min * 1e3,
+                "p50_ms": self.percentile(0.5) * 1e3,
+                "p90_ms": self.percentile(0.9) * 1e3,
+                "p99_ms": self.percentile(0.99) * 1e3,
+                "max_ms": self.__max * 1e3}
+
+
+class Instrumentation:
+    """
+    Collects counters and latency histograms of a game.
+    Models take an optional Instrumentation object and skip all measuring when it is None,
+    so disabled instrumentation only costs a None check.
+    """
+
+    def __init__(self, output_path: str | None = None, profiler=None, move_profiler=None):
+        """
+        Initializes Instrumentation class.
+        :param output_path: JSON file which summary is appended to at the end of each game. Summary is only logged
+        when it is None.
+        :param profiler: An object with enable() and disable() methods (e.g. cProfile.Profile) which runs
+        around a single game. A profiler only sees the thread which enabled it, so it covers the work of the user
+        interface thread; moves of computer which a MoveWorker computes are not included.
+        :param move_profiler: An object like profiler which runs around each move of ComputerPlayer, on the thread
+        which computes the move. It should not be the same object as profiler.
+        """
+        self.__output_path = output_path
+        self.__profiler = profiler
+        self.__move_profiler = move_profiler
+        self.__counters = {}
+        self.__histograms = {}
+        self.__started_at = None
+
+    # Determines the profiler which runs around the game on the user interface thread.
+    @property
+    def profiler(self):
+        return self.__profiler
+
+    # Determines the profiler which runs around each move of computer.
+    @property
+    def move_profiler(self):
+        return self.__move_profiler
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """
+        Increases a counter.
+        :param name: Name of counter.
+        :param amount: Amount which is added to counter.
+        :return: None
+        """
+        self.__counters[name] = self.__counters.get(name, 0) + amount
+
+    def record(self, name: str, seconds: float) -> None:
+        """
+        Adds a latency to a histogram.
+        :param name: Name of histogram.
+        :param seconds: Latency in seconds.
+        :return: None
+        """
+        histogram = self.__histograms.get(name)
+        if histogram is None:
+            histogram = self.__histograms[name] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def start_game(self) -> None:
+        """
+        Marks start of a game and enables profiler.
+        :return: None
+        """
+        self.__started_at = time.perf_counter()
+        if self.__profiler is not None:
+            self.__profiler.enable()
+
+    def summary(self) -> dict:
+        """
+        Gets all counters and histograms.
+        """
+        return {"counters": dict(self.__counters),
+                "latencies": {name: histogram.summary() for name, histogram in self.__histograms.items()}}
+
+    def finish_game(self, result: str) -> dict:
+        """
+        Marks end of a game, disables profiler and exports summary as a log line and as JSON.
+        Counters and histograms are cleared afterwards, so the next game starts from zero.
+        :param result: Result of the game which is added to summary.
+        :return: Summary of the game.
+        """
+        if self.__profiler is not None:
+            self.__profiler.disable()
+        summary = self.summary()
+        summary["result"] = result
+        if self.__started_at is not None:
+            summary["duration_s"] = time.perf_counter() - self.__started_at
+        line = json.dumps(summary)
+        logger.info("game summary %s", line)
+        if self.__output_path is not None:
+            with open(self.__output_path, "a") as file:
+                file.write(line + "\n")
+        self.__counters = {}
+        self.__histograms = {}
+        self.__started_at = None
+        return summary
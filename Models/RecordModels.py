@@ -0,0 +1,205 @@
+from Models.HelpingModels import *
+import mmap
+import os
+import struct
+from typing import NamedTuple
+
+
+class GameRecord(NamedTuple):
+    """
+    Determines a finished game between user and computer.
+    """
+    moves: tuple  # Positions in order they were played, starting with the move of starter.
+    computer_started: bool
+    user_marker: PlayerMarker
+    outcome: GameStatus  # UserWon, ComputerWon or Tie
+
+
+class GameRecordLog:
+    """
+    Determines format of the binary game-record log.
+    A log starts with an 8-byte header (magic, version, width, height, win length) and continues with records:
+        1 byte flags: bits 0-2 outcome (value of GameStatus), bit 3 computer started, bit 4 user marker is O
+        1 byte number of moves (2 bytes in version 2, which is used for boards with more than 255 positions)
+        moves: 4 bits each on boards with at most 16 positions (two per byte), otherwise 1 or 2 bytes each.
+    A 3x3 game takes at most 7 bytes.
+    """
+    header = struct.Struct("<4sBBBB")
+    magic = b"TTTR"
+    versions = (1, 2)
+
+    @staticmethod
+    def version(width: int, height: int) -> int:
+        """
+        Gets version of the log of a board; logs of boards with at most 255 positions keep the original format.
+        """
+        return 1 if width * height <= 255 else 2
+
+    @staticmethod
+    def count_bytes(version: int) -> int:
+        """
+        Gets number of bytes which the number of moves of a record takes.
+        """
+        return 1 if version == 1 else 2
+
+    @staticmethod
+    def move_bits(width: int, height: int) -> int:
+        """
+        Gets number of bits which a move takes on a board.
+        """
+        size = width * height
+        return 4 if size <= 16 else 8 if size <= 256 else 16
+
+    @staticmethod
+    def moves_length(move_bits: int, count: int) -> int:
+        """
+        Gets number of bytes which count moves take.
+        """
+        return (count * move_bits + 7) // 8
+
+
+class GameRecordWriter:
+    """
+    Appends game records to a log file.
+    Can be used as a context manager.
+    """
+
+    def __init__(self, path: str, width: int = 3, height: int = 3, win_length: int = 3):
+        """
+        Initializes GameRecordWriter class. Header is written when file is new, otherwise it should match board size.
+        :param path: Path of log file.
+        :param width: Number of columns of board of the games.
+        :param height: Number of rows of board of the games.
+        :param win_length: Number of markers in a row which are needed to win the games.
+        """
+        if not 0 < width <= 255 or not 0 < height <= 255:
+            raise ValueError("Width and height of board should be between 1 and 255.")
+        self.__size = width * height
+        self.__move_bits = GameRecordLog.move_bits(width, height)
+        version = GameRecordLog.version(width, height)
+        self.__count_bytes = GameRecordLog.count_bytes(version)
+        header = GameRecordLog.header.pack(GameRecordLog.magic, version, width, height, win_length)
+        self.__file = open(path, "ab+")
+        if self.__file.tell() == 0:
+            self.__file.write(header)
+            self.__file.flush()
+        else:
+            self.__file.seek(0)
+            existing = self.__file.read(GameRecordLog.header.size)
+            self.__file.seek(0, os.SEEK_END)
+            if existing != header:
+                self.__file.close()
+                raise ValueError(f"{path} is not a game-record log of the same board size.")
+
+    def write(self, record: GameRecord) -> None:
+        """
+        Appends a record to the log.
+        :param record: A finished game.
+        :return: None
+        """
+        if len(record.moves) > self.__size or not all(0 <= move < self.__size for move in record.moves):
+            raise ValueError("Moves of record are not on board of log.")
+        flags = record.outcome.value | record.computer_started << 3 | (record.user_marker == PlayerMarker.Circle) << 4
+        self.__file.write(bytes((flags,)) + len(record.moves).to_bytes(self.__count_bytes, "little") +
+                          self.__pack_moves(record.moves))
+        self.__file.flush()
+
+    def __pack_moves(self, moves: tuple) -> bytes:
+        if self.__move_bits == 4:
+            packed = bytearray(GameRecordLog.moves_length(4, len(moves)))
+            for i, move in enumerate(moves):
+                packed[i // 2] |= move << 4 * (i % 2)
+            return bytes(packed)
+        if self.__move_bits == 8:
+            return bytes(moves)
+        return struct.pack(f"<{len(moves)}H", *moves)
+
+    def close(self) -> None:
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class GameRecordReader:
+    """
+    Reads a game-record log through a memory map.
+    Records are decoded lazily while iterating, so logs of any size can be read without loading them into memory.
+    Can be used as a context manager.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initializes GameRecordReader class.
+        :param path: Path of log file.
+        """
+        self.__file = open(path, "rb")
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.__width, self.__height, self.__win_length = GameRecordLog.header.unpack_from(self.__map)
+        if magic != GameRecordLog.magic or version not in GameRecordLog.versions:
+            self.close()
+            raise ValueError(f"{path} is not a game-record log.")
+        self.__move_bits = GameRecordLog.move_bits(self.__width, self.__height)
+        self.__count_bytes = GameRecordLog.count_bytes(version)
+
+    # Determines board size of the games of log as (width, height, win length).
+    @property
+    def board_size(self) -> tuple:
+        return self.__width, self.__height, self.__win_length
+
+    def __iter__(self):
+        data = self.__map
+        move_bits = self.__move_bits
+        offset = GameRecordLog.header.size
+        end = len(data)
+        count_bytes = self.__count_bytes
+        while offset + 1 + count_bytes <= end:
+            flags = data[offset]
+            count = data[offset + 1] if count_bytes == 1 else data[offset + 1] | data[offset + 2] << 8
+            offset += 1 + count_bytes
+            length = GameRecordLog.moves_length(move_bits, count)
+            if offset + length > end:
+                break  # Last record was not written completely.
+            if move_bits == 4:
+                moves = tuple(data[offset + i // 2] >> 4 * (i % 2) & 0xF for i in range(count))
+            elif move_bits == 8:
+                moves = tuple(data[offset:offset + length])
+            else:
+                moves = struct.unpack_from(f"<{count}H", data, offset)
+            offset += length
+            yield GameRecord(moves, bool(flags >> 3 & 1),
+                             PlayerMarker.Circle if flags >> 4 & 1 else PlayerMarker.Cross, GameStatus(flags & 7))
+
+    def outcome_counts(self) -> dict:
+        """
+        Counts outcomes of all games by who started, without decoding the moves.
+        :return: Dictionary of (computer started, outcome) => number of games.
+        """
+        counts = {}
+        data = self.__map
+        move_bits = self.__move_bits
+        offset = GameRecordLog.header.size
+        end = len(data)
+        count_bytes = self.__count_bytes
+        while offset + 1 + count_bytes <= end:
+            flags = data[offset]
+            count = data[offset + 1] if count_bytes == 1 else data[offset + 1] | data[offset + 2] << 8
+            offset += 1 + count_bytes + GameRecordLog.moves_length(move_bits, count)
+            if offset > end:
+                break
+            key = flags & 0xF
+            counts[key] = counts.get(key, 0) + 1
+        return {(bool(key >> 3), GameStatus(key & 7)): count for key, count in counts.items()}
+
+    def close(self) -> None:
+        self.__map.close()
+        self.__file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
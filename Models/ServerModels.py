@@ -0,0 +1,304 @@
+from Models.StrategyModels import *
+from Models.SessionModels import *
+import asyncio
+import concurrent.futures
+import json
+import logging
+import weakref
+
+logger = logging.getLogger(__name__)
+_process_strategy = None  # Strategy of a search process of GameServer.
+
+
+def _start_search_process(strategy: str) -> None:
+    # Initializer of search processes; each process keeps one instance of strategy, so its tables are reused.
+    global _process_strategy
+    _process_strategy = STRATEGIES[strategy]()
+
+
+def _search_move(task: tuple) -> int | None:
+    """
+    Chooses a move of computer in a search process of GameServer. Task only has integers, so it is small to send and
+    does not refer to a board which the server reuses.
+    :param task: (width, height, win length, bitboard of X, bitboard of O, marker of computer).
+    :return: Selected position on board.
+    """
+    width, height, win_length, cross, circle, player_marker = task
+    board = Board(width, height, win_length)
+    board.set_position(cross, circle)
+    return _process_strategy.choose_move(board, player_marker)
+
+
+class GameSession:
+    """
+    Determines a game between a remote user and computer.
+    Handles requests of the line-delimited JSON protocol of GameServer:
+        {"op": "new", "marker": "X" | "O", "starter": "user" | "computer", "width": 3, "height": 3, "win_length": 3}
+        {"op": "move", "position": 4}
+        {"op": "state"}
+    Every response has "ok"; successful responses also have the board, status and the move of computer.
+    The game itself is kept in a slot of a SessionStore; session only holds its handle and a weak reference to the
+    store, so an idle session does not keep a dropped store in memory.
+    """
+
+    def __init__(self, strategy: Strategy, stores: SessionStores, executor: concurrent.futures.Executor | None = None):
+        """
+        Initializes GameSession class.
+        :param strategy: The Strategy of computer. It can be shared by all sessions.
+        :param stores: SessionStores which games are kept in. It is shared by all sessions.
+        :param executor: Executor whose workers search moves of computer with their own strategy (see
+        _start_search_process). Moves are chosen by strategy on the calling thread when it is None.
+        """
+        self.__strategy = strategy
+        self.__stores = stores
+        self.__executor = executor
+        self.__store = None  # Weak reference to the SessionStore of the game.
+        self.__handle = None
+
+    # Determines status of the game from point of view of user.
+    @property
+    def status(self) -> GameStatus:
+        store = self.__game_store()
+        if store is None:
+            return GameStatus.Starting
+        return store.status(self.__handle[0])
+
+    def __game_store(self) -> SessionStore | None:
+        # Store of the game, or None when there is no game or it was released (e.g. expired).
+        store = self.__store() if self.__store is not None else None
+        if store is None or not store.is_valid(self.__handle):
+            return None
+        return store
+
+    async def handle(self, request: dict) -> dict:
+        """
+        Handles a request of client. Other sessions are served while computer searches its move in executor.
+        :param request: Decoded JSON request.
+        :return: Response which should be sent to client.
+        """
+        op = request.get("op")
+        try:
+            if op == "new":
+                computer_move = await self.__new_game(request)
+            elif op == "move":
+                computer_move = await self.__move(request.get("position"))
+            elif op == "state":
+                computer_move = None
+            else:
+                return {"ok": False, "error": f"Unknown op: {op}"}
+        except (ValueError, TypeError) as error:
+            return {"ok": False, "error": str(error)}
+        store = self.__game_store()
+        if store is None:
+            return {"ok": True, "status": GameStatus.Starting.name, "board": "", "computer_move": computer_move}
+        slot = self.__handle[0]
+        store.touch(slot)
+        return {"ok": True, "status": store.status(slot).name, "board": store.board_text(slot),
+                "computer_move": computer_move}
+
+    def close(self) -> None:
+        """
+        Releases slot of the game.
+        :return: None
+        """
+        store = self.__game_store()
+        if store is not None:
+            store.release(self.__handle[0])
+        self.__store = None
+        self.__handle = None
+
+    async def __new_game(self, request: dict) -> int | None:
+        marker = PlayerMarker(request.get("marker", "X"))
+        size = (int(request.get("width", 3)), int(request.get("height", 3)), int(request.get("win_length", 3)))
+        if size[0] * size[1] > 400:
+            raise ValueError("Board is too big.")
+        self.close()
+        store = self.__stores.get(*size, check=self.__check_board_size)
+        self.__handle = store.create(marker, request.get("starter", "user") == "computer")
+        self.__store = weakref.ref(store)
+        if store.current_marker(self.__handle[0]) != marker:
+            return await self.__computer_move()
+        return None
+
+    async def __move(self, position) -> int | None:
+        store = self.__game_store()
+        if store is None or store.status(self.__handle[0]) != GameStatus.InProgress:
+            raise ValueError("There is no game in progress.")
+        if store.current_marker(self.__handle[0]) != store.user_marker(self.__handle[0]):
+            raise ValueError("It is not your turn.")
+        # JSON true and false are ints in Python too.
+        if not isinstance(position, int) or isinstance(position, bool):
+            raise ValueError("Position is not on board.")
+        slot = self.__handle[0]
+        store.make_move(slot, position)
+        if store.status(slot) != GameStatus.InProgress:
+            return None
+        return await self.__computer_move()
+
+    def __check_board_size(self, width: int, height: int, win_length: int) -> None:
+        # Strategies which cannot play on a board raise ValueError for its empty board (e.g. PerfectStrategy on 4x4).
+        # Strategies of executor search boards of any size, so they are not asked.
+        board = Board(width, height, win_length)
+        if self.__executor is None:
+            self.__strategy.choose_move(board, PlayerMarker.Cross)
+
+    async def __computer_move(self) -> int | None:
+        try:
+            return await self.__make_computer_move()
+        except ValueError:
+            self.close()  # Game cannot go on without the move of computer.
+            raise
+
+    async def __make_computer_move(self) -> int | None:
+        store, handle = self.__game_store(), self.__handle
+        slot = handle[0]
+        player_marker = store.current_marker(slot)
+        if self.__executor is None:
+            position = self.__strategy.choose_move(store.load(slot), player_marker)
+        else:
+            width, height, win_length = store.board_size
+            task = (width, height, win_length, store.bitboard(slot, PlayerMarker.Cross),
+                    store.bitboard(slot, PlayerMarker.Circle), player_marker)
+            position = await asyncio.get_running_loop().run_in_executor(self.__executor, _search_move, task)
+            if self.__game_store() is not store or self.__handle != handle:
+                raise ValueError("Game expired while computer was thinking.")
+        if position is not None:
+            store.make_move(slot, position)
+        return position
+
+
+class GameServer:
+    """
+    Hosts many concurrent games against computer with asyncio; one game session per connection.
+    Games are kept in a SessionStore per board size and all of them are played by a single Strategy. Strategies which
+    search (e.g. alphabeta and mcts) run in a process pool, so a long search does not stop the other connections.
+    Responses are only read from a connection after the previous response was written (drained), so a slow client
+    cannot make the server buffer without limit. Connections which stay idle longer than idle_timeout are closed.
+    """
+
+    # Strategies which answer in constant time on the supported boards, so they run on the event loop.
+    inline_strategies = ("rules", "random", "perfect", "tablebase")
+
+    def __init__(self, strategy: str = "rules", max_sessions: int = 10000, idle_timeout: float = 60.0,
+                 finished_timeout: float = 10.0, processes: int | None = None, max_stores: int = 16):
+        """
+        Initializes GameServer class.
+        :param strategy: Name of strategy of computer in STRATEGIES. One instance of it plays all games.
+        :param max_sessions: Maximum number of concurrent sessions; new connections are refused after that.
+        :param idle_timeout: Seconds that a connection can stay silent before its session is evicted.
+        :param finished_timeout: Seconds that a finished game is kept before its slot is released.
+        :param processes: Number of search processes for strategies which are not in inline_strategies. Number of
+        CPUs is used when it is None.
+        :param max_stores: Maximum number of board sizes which can be played at the same time. Each one takes a
+        SessionStore of max_sessions games.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy: {strategy}")
+        self.__strategy_name = strategy
+        self.__strategy = STRATEGIES[strategy]()
+        self.__processes = processes
+        self.__executor = None  # Started by serve.
+        self.__max_sessions = max_sessions
+        self.__idle_timeout = idle_timeout
+        self.__finished_timeout = finished_timeout
+        self.__stores = SessionStores(max_sessions, max_stores)
+        self.__sessions = 0
+        self.__stats = {"connections": 0, "refused": 0, "evicted": 0, "expired": 0, "requests": 0}
+
+    # Determines number of active sessions.
+    @property
+    def sessions(self) -> int:
+        return self.__sessions
+
+    # Determines counters of the server.
+    @property
+    def stats(self) -> dict:
+        return dict(self.__stats, sessions=self.__sessions, games=self.__stores.size, stores=self.__stores.count,
+                    memory=self.__stores.memory)
+
+    def expire(self) -> int:
+        """
+        Releases slots of games which were idle longer than idle_timeout, or finished longer than finished_timeout ago.
+        Stores which have no game left are dropped.
+        :return: Number of released games.
+        """
+        released = self.__stores.expire(self.__idle_timeout, self.__finished_timeout)
+        self.__stats["expired"] += released
+        return released
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serves one connection until client closes it, it stays idle too long or sends an invalid line.
+        """
+        if self.__sessions >= self.__max_sessions:
+            self.__stats["refused"] += 1
+            await self.__send(writer, {"ok": False, "error": "Server is full."})
+            writer.close()
+            return
+        self.__sessions += 1
+        self.__stats["connections"] += 1
+        session = GameSession(self.__strategy, self.__stores, self.__executor)
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.__idle_timeout)
+                except asyncio.TimeoutError:
+                    self.__stats["evicted"] += 1
+                    break
+                if not line:
+                    break
+                self.__stats["requests"] += 1
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    await self.__send(writer, {"ok": False, "error": "Invalid JSON."})
+                    continue
+                if not isinstance(request, dict):
+                    response = {"ok": False, "error": "Request should be an object."}
+                elif request.get("op") == "stats":
+                    response = {"ok": True, "stats": self.stats}
+                else:
+                    response = await session.handle(request)
+                await self.__send(writer, response)
+        except (ConnectionError, ValueError):
+            pass  # Client disconnected or sent a line longer than the limit of reader.
+        finally:
+            self.__sessions -= 1
+            session.close()
+            writer.close()
+
+    @staticmethod
+    async def __send(writer: asyncio.StreamWriter, response: dict) -> None:
+        writer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+        await writer.drain()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765, path: str | None = None) -> None:
+        """
+        Runs the server forever on a TCP port, or on a Unix socket when path is given.
+        """
+        if path is not None:
+            server = await asyncio.start_unix_server(self.handle_connection, path, limit=4096, backlog=1024)
+            logger.info("serving on %s", path)
+        else:
+            server = await asyncio.start_server(self.handle_connection, host, port, limit=4096, backlog=1024)
+            logger.info("serving on %s:%s", host, port)
+        if self.__strategy_name not in GameServer.inline_strategies:
+            self.__executor = concurrent.futures.ProcessPoolExecutor(
+                self.__processes, initializer=_start_search_process, initargs=(self.__strategy_name,))
+        async with server:
+            expiry = asyncio.create_task(self.__expire_periodically())
+            try:
+                await server.serve_forever()
+            finally:
+                expiry.cancel()
+                if self.__executor is not None:
+                    self.__executor.shutdown(cancel_futures=True)
+                    self.__executor = None
+
+    async def __expire_periodically(self) -> None:
+        # Releases expired games in bulk instead of keeping a timer per game.
+        while True:
+            await asyncio.sleep(min(self.__idle_timeout, self.__finished_timeout) / 2)
+            released = self.expire()
+            if released:
+                logger.info("released %d expired games", released)
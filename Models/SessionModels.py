@@ -0,0 +1,295 @@
+from Models.CoreModels import *
+import array
+import time
+
+
+class SessionStore:
+    """
+    Keeps many games between remote users and computer in preallocated arrays instead of an object per game.
+    A game takes a slot: bitboards of X and O (ceil(width * height / 8) bytes each), number of moves, flags
+    (status, user marker, starter), generation, the second it was last active and an entry of the free-list;
+    17 bytes on 3x3 board.
+    Released slots are pushed on a free-list and reused. Every release increments generation of slot, so a handle
+    (slot, generation) of an expired game does not refer to the next game of that slot.
+    All games of a store have the same board size.
+    """
+    # Bits of flags of a slot.
+    status_mask = 0x07  # Value of GameStatus; Starting means slot is free.
+    circle_flag = 0x08  # User plays O.
+    computer_started_flag = 0x10
+    statuses = tuple(GameStatus)  # GameStatus of each value, which is faster than calling GameStatus.
+
+    def __init__(self, capacity: int, width: int = 3, height: int = 3, win_length: int = 3):
+        """
+        Initializes SessionStore class and allocates all of its slots.
+        :param capacity: Maximum number of concurrent games.
+        :param width: Number of columns of board of the games.
+        :param height: Number of rows of board of the games.
+        :param win_length: Number of markers in a row which are needed to win the games.
+        """
+        self.__board = Board(width, height, win_length)  # Used for finding winners and as board of strategies.
+        self.__capacity = capacity
+        self.__places = width * height
+        self.__board_bytes = (self.__places + 7) // 8
+        self.__bitboards = bytearray(2 * self.__board_bytes * capacity)
+        self.__turns = array.array("H", bytes(2 * capacity))
+        self.__flags = bytearray(capacity)
+        self.__generations = array.array("H", bytes(2 * capacity))
+        self.__last_active = array.array("I", bytes(4 * capacity))  # Seconds since start of store.
+        self.__free_slots = array.array("I", range(capacity - 1, -1, -1))  # Stack; slot 0 is used first.
+        self.__start = time.monotonic()
+
+    # Determines maximum number of concurrent games.
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    # Determines number of games in store.
+    @property
+    def size(self) -> int:
+        return self.__capacity - len(self.__free_slots)
+
+    # Determines board size of the games as (width, height, win length).
+    @property
+    def board_size(self) -> tuple:
+        return self.__board.width, self.__board.height, self.__board.win_length
+
+    # Determines number of bytes which arrays of store take.
+    @property
+    def memory(self) -> int:
+        return len(self.__bitboards) + len(self.__flags) + sum(
+            len(column) * column.itemsize
+            for column in (self.__turns, self.__generations, self.__last_active, self.__free_slots))
+
+    def create(self, user_marker: PlayerMarker, computer_started: bool) -> tuple:
+        """
+        Starts a new game in a free slot.
+        :param user_marker: Marker of user (X or O).
+        :param computer_started: Determines that if computer makes the first move.
+        :return: Handle of the game as (slot, generation).
+        """
+        if user_marker == PlayerMarker.Unspecified:
+            raise ValueError("Marker should be X or O.")
+        if not self.__free_slots:
+            raise ValueError("Server is full.")
+        slot = self.__free_slots.pop()
+        offset = 2 * self.__board_bytes * slot
+        self.__bitboards[offset:offset + 2 * self.__board_bytes] = bytes(2 * self.__board_bytes)
+        self.__turns[slot] = 0
+        self.__flags[slot] = GameStatus.InProgress.value | (user_marker == PlayerMarker.Circle) * \
+            SessionStore.circle_flag | computer_started * SessionStore.computer_started_flag
+        self.touch(slot)
+        return slot, self.__generations[slot]
+
+    def release(self, slot: int) -> None:
+        """
+        Frees slot of a game.
+        :param slot: Slot of the game.
+        :return: None
+        """
+        if not self.__flags[slot] & SessionStore.status_mask:
+            return
+        self.__flags[slot] = 0
+        self.__generations[slot] = (self.__generations[slot] + 1) & 0xFFFF
+        self.__free_slots.append(slot)
+
+    def is_valid(self, handle: tuple) -> bool:
+        """
+        Checks that if a handle still refers to its game.
+        :param handle: (slot, generation) which was returned by create.
+        :return: False when game was released or expired.
+        """
+        slot, generation = handle
+        return self.__generations[slot] == generation and bool(self.__flags[slot] & SessionStore.status_mask)
+
+    def touch(self, slot: int) -> None:
+        """
+        Marks a game as active now.
+        :param slot: Slot of the game.
+        :return: None
+        """
+        self.__last_active[slot] = int(time.monotonic() - self.__start)
+
+    def status(self, slot: int) -> GameStatus:
+        """
+        Gets status of a game from point of view of user. Free slots are in Starting status.
+        """
+        return SessionStore.statuses[self.__flags[slot] & SessionStore.status_mask]
+
+    def user_marker(self, slot: int) -> PlayerMarker:
+        """
+        Gets marker of user in a game.
+        """
+        return PlayerMarker.Circle if self.__flags[slot] & SessionStore.circle_flag else PlayerMarker.Cross
+
+    def current_marker(self, slot: int) -> PlayerMarker:
+        """
+        Gets marker of the player who should move in a game.
+        """
+        flags = self.__flags[slot]
+        # User moves first on even turns unless computer started; X and O swap when user plays O.
+        user_moves = (self.__turns[slot] % 2 == 0) != bool(flags & SessionStore.computer_started_flag)
+        return PlayerMarker.Circle if user_moves == bool(flags & SessionStore.circle_flag) else PlayerMarker.Cross
+
+    def bitboard(self, slot: int, player_marker: PlayerMarker) -> int:
+        """
+        Gets bitboard of a player in a game.
+        """
+        offset = (2 * slot + (player_marker == PlayerMarker.Circle)) * self.__board_bytes
+        return int.from_bytes(self.__bitboards[offset:offset + self.__board_bytes], "little")
+
+    def load(self, slot: int) -> Board:
+        """
+        Copies position of a game to the board of store, which can be given to a strategy.
+        Board is reused by the next load, so it should not be kept.
+        :param slot: Slot of the game.
+        :return: Board of store.
+        """
+        status = self.status(slot)
+        winner = PlayerMarker.Unspecified
+        if status == GameStatus.UserWon:
+            winner = self.user_marker(slot)
+        elif status == GameStatus.ComputerWon:
+            winner = self.user_marker(slot).opponent
+        self.__board.set_position(self.bitboard(slot, PlayerMarker.Cross), self.bitboard(slot, PlayerMarker.Circle),
+                                  winner == PlayerMarker.Cross, winner == PlayerMarker.Circle)
+        return self.__board
+
+    def make_move(self, slot: int, position: int) -> None:
+        """
+        Places marker of the player who should move on position and updates status of the game.
+        :param slot: Slot of the game.
+        :param position: Position on board.
+        :return: None
+        """
+        flags = self.__flags[slot]
+        if flags & SessionStore.status_mask != GameStatus.InProgress.value:
+            raise ValueError("There is no game in progress.")
+        if not 0 <= position < self.__places:
+            raise ValueError("Position is not on board.")
+        player_marker = self.current_marker(slot)
+        size = self.__board_bytes
+        offset = 2 * slot * size
+        cross = int.from_bytes(self.__bitboards[offset:offset + size], "little")
+        circle = int.from_bytes(self.__bitboards[offset + size:offset + 2 * size], "little")
+        if (cross | circle) >> position & 1:
+            raise ValueError(f"Position {position} is occupied.")
+        if player_marker == PlayerMarker.Circle:
+            offset += size
+            selected = circle | 1 << position
+        else:
+            selected = cross | 1 << position
+        self.__bitboards[offset:offset + size] = selected.to_bytes(size, "little")
+        self.__turns[slot] += 1
+        if self.__board.makes_row(selected, position):
+            user_won = (player_marker == PlayerMarker.Circle) == bool(flags & SessionStore.circle_flag)
+            status = GameStatus.UserWon if user_won else GameStatus.ComputerWon
+        elif self.__turns[slot] == self.__places:
+            status = GameStatus.Tie
+        else:
+            status = GameStatus.InProgress
+        self.__flags[slot] = flags & ~SessionStore.status_mask | status.value
+        self.touch(slot)
+
+    def board_text(self, slot: int) -> str:
+        """
+        Gets board of a game as text; "." for unoccupied positions, row by row.
+        """
+        cross = self.bitboard(slot, PlayerMarker.Cross)
+        circle = self.bitboard(slot, PlayerMarker.Circle)
+        return "".join("X" if cross >> i & 1 else "O" if circle >> i & 1 else "."
+                       for i in range(self.__places))
+
+    def expire(self, idle: float, finished_only: bool = False) -> int:
+        """
+        Releases all games which were not active for idle seconds, in a single pass over the slots.
+        :param idle: Minimum seconds since the last activity of a game.
+        :param finished_only: Determines that if only finished games are released.
+        :return: Number of released games.
+        """
+        limit = time.monotonic() - self.__start - idle
+        flags = self.__flags
+        last_active = self.__last_active
+        status_mask = SessionStore.status_mask
+        in_progress = GameStatus.InProgress.value
+        released = 0
+        for slot in range(self.__capacity):
+            status = flags[slot] & status_mask
+            if status and last_active[slot] <= limit and not (finished_only and status == in_progress):
+                self.release(slot)
+                released += 1
+        return released
+
+
+class SessionStores:
+    """
+    Determines the SessionStores of a server, one for each board size which is in use.
+    At most max_stores stores of capacity games are kept, so memory is bounded however many board sizes clients ask
+    for. Stores which have no game are dropped when the limit is reached and whenever games are expired.
+    """
+
+    def __init__(self, capacity: int, max_stores: int = 16):
+        """
+        Initializes SessionStores class. Stores are created when a board size is used for the first time.
+        :param capacity: Maximum number of concurrent games of each board size.
+        :param max_stores: Maximum number of board sizes which can be in use at the same time.
+        """
+        self.__capacity = capacity
+        self.__max_stores = max_stores
+        self.__stores = {}  # (width, height, win length) => SessionStore.
+
+    # Determines number of stores.
+    @property
+    def count(self) -> int:
+        return len(self.__stores)
+
+    # Determines number of games in all stores.
+    @property
+    def size(self) -> int:
+        return sum(store.size for store in self.__stores.values())
+
+    # Determines number of bytes which arrays of all stores take.
+    @property
+    def memory(self) -> int:
+        return sum(store.memory for store in self.__stores.values())
+
+    def get(self, width: int, height: int, win_length: int, check=None) -> SessionStore:
+        """
+        Gets store of a board size, which is created if it does not exist.
+        :param width: Number of columns of board.
+        :param height: Number of rows of board.
+        :param win_length: Number of markers in a row which are needed to win the game.
+        :param check: Function which is called with the board size before a store is created for it (e.g. to check
+        that a strategy can play on it). Store is not created when it raises.
+        :return: SessionStore of the board size.
+        """
+        board_size = (width, height, win_length)
+        store = self.__stores.get(board_size)
+        if store is None:
+            if len(self.__stores) >= self.__max_stores:
+                self.__drop_empty_stores()
+                if len(self.__stores) >= self.__max_stores:
+                    raise ValueError("Too many board sizes are in use.")
+            if check is not None:
+                check(width, height, win_length)
+            store = SessionStore(self.__capacity, width, height, win_length)
+            self.__stores[board_size] = store
+        return store
+
+    def expire(self, idle: float, finished_idle: float) -> int:
+        """
+        Releases games of all stores which were not active for idle seconds, or finished_idle seconds when they are
+        finished, then drops the stores which have no game.
+        :return: Number of released games.
+        """
+        released = 0
+        for store in self.__stores.values():
+            released += store.expire(idle)
+            released += store.expire(finished_idle, finished_only=True)
+        self.__drop_empty_stores()
+        return released
+
+    def __drop_empty_stores(self) -> None:
+        for board_size, store in list(self.__stores.items()):
+            if not store.size:
+                del self.__stores[board_size]
@@ -0,0 +1,664 @@
+from Models.CoreModels import *
+from Models.TablebaseModels import *
+import array
+import math
+import multiprocessing
+import random
+import time
+
+
+def _build_symmetries() -> tuple:
+    """
+    Builds lookup tables of the 8 rotations and reflections of a 3x3 board.
+    :return: Tuple of 8 tables, each table maps a bitboard to its transformed bitboard.
+    """
+    permutations = []
+    cells = list(range(9))
+    for _ in range(4):
+        # Rotates board 90 degrees clockwise.
+        cells = [cells[6 - 3 * (i % 3) + i // 3] for i in range(9)]
+        permutations.append(cells)
+        # Reflects rotated board horizontally.
+        permutations.append([cells[3 * (i // 3) + 2 - i % 3] for i in range(9)])
+    tables = []
+    for permutation in permutations:
+        table = []
+        for bits in range(1 << 9):
+            transformed = 0
+            for i in range(9):
+                if bits >> permutation[i] & 1:
+                    transformed |= 1 << i
+            table.append(transformed)
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+class PerfectStrategy(Strategy):
+    """
+    Determines a strategy which never loses on 3x3 board.
+    Solves the whole game tree once and keeps result of every position in a transposition table.
+    Positions are stored under their canonical form among the 8 rotations and reflections of board,
+    so each distinct position is solved only once and later moves are table lookups.
+    """
+    name = "perfect"
+    symmetries = _build_symmetries()
+    wining_masks = tuple(sum(1 << i for i in case) for case in Board.get_wining_cases(3, 3, 3))
+    full_mask = (1 << 9) - 1
+    __table = {}  # Shared between all instances; values only depend on the position.
+
+    @staticmethod
+    def canonical_key(mover: int, opponent: int) -> int:
+        """
+        Gets key of a position in transposition table.
+        :param mover: Bitboard of the player who should move.
+        :param opponent: Bitboard of the other player.
+        :return: Smallest encoding of position among all of its symmetries.
+        """
+        return min(table[mover] << 9 | table[opponent] for table in PerfectStrategy.symmetries)
+
+    @staticmethod
+    def __has_won(bits: int) -> bool:
+        for mask in PerfectStrategy.wining_masks:
+            if bits & mask == mask:
+                return True
+        return False
+
+    def solve(self, mover: int, opponent: int) -> int:
+        """
+        Gets game-theoretic value of a position for the player who should move.
+        Positive values are wins, negative values are losses and 0 is a tie. Faster wins have bigger values.
+        :param mover: Bitboard of the player who should move.
+        :param opponent: Bitboard of the other player.
+        :return: Value of position.
+        """
+        key = PerfectStrategy.canonical_key(mover, opponent)
+        value = PerfectStrategy.__table.get(key)
+        if value is not None:
+            return value
+        empty = PerfectStrategy.full_mask & ~(mover | opponent)
+        if PerfectStrategy.__has_won(opponent):
+            value = -(empty.bit_count() + 1)
+        elif not empty:
+            value = 0
+        else:
+            value = -10
+            while empty:
+                move = empty & -empty
+                empty ^= move
+                value = max(value, -self.solve(opponent, mover | move))
+        PerfectStrategy.__table[key] = value
+        return value
+
+    def choose_move(self, board: Board, player_marker: PlayerMarker) -> int | None:
+        """
+        Chooses one of the best moves of player.
+        :param board: Current board of the game.
+        :param player_marker: Determines player (X or O) who should move.
+        :return: Selected position on board. It returns None when board is full.
+        """
+        if (board.width, board.height, board.win_length) != (3, 3, 3):
+            raise ValueError("PerfectStrategy only supports 3x3 boards.")
+        other_marker = player_marker.opponent
+        mover = board.bitboard(player_marker)
+        opponent = board.bitboard(other_marker)
+        best_value = None
+        best_moves = []
+        for position in board.check_unoccupied_places(*range(9)):
+            value = -self.solve(opponent, mover | 1 << position)
+            if best_value is None or value > best_value:
+                best_value = value
+                best_moves = [position]
+            elif value == best_value:
+                best_moves.append(position)
+        return random.choice(best_moves) if best_moves else None
+
+
+class LineEvaluator:
+    """
+    Evaluates a position by counting markers of each player in the wining cases which are still open
+    (not blocked by the other player). Longer open rows are worth exponentially more.
+    Any object with the same evaluate method can be used as evaluator of AlphaBetaStrategy.
+    """
+
+    def __init__(self, base: int = 10):
+        """
+        Initializes LineEvaluator class.
+        :param base: Worth of an open row grows by this factor for each marker in it.
+        """
+        self.__base = base
+        self.__masks = {}  # Masks of wining cases for each size of board.
+
+    def evaluate(self, board: Board, mover: int, opponent: int) -> int:
+        """
+        Evaluates a position for the player who should move.
+        :param board: Board of the game (only used for its size).
+        :param mover: Bitboard of the player who should move.
+        :param opponent: Bitboard of the other player.
+        :return: Score of position; positive values are better for mover.
+        """
+        size = (board.width, board.height, board.win_length)
+        masks = self.__masks.get(size)
+        if masks is None:
+            masks = tuple(sum(1 << i for i in case) for case in Board.get_wining_cases(*size))
+            self.__masks[size] = masks
+        base = self.__base
+        score = 0
+        for mask in masks:
+            own = mover & mask
+            other = opponent & mask
+            if own and not other:
+                score += base ** own.bit_count()
+            elif other and not own:
+                score -= base ** other.bit_count()
+        return score
+
+
+class _SearchTimeout(Exception):
+    """
+    Raised inside search when the time budget of a move is finished.
+    """
+    pass
+
+
+class AlphaBetaStrategy(Strategy):
+    """
+    Determines a strategy for boards of any size.
+    Uses iterative-deepening alpha-beta search which only tries positions near existing markers and orders moves
+    by transposition table, killer moves and history heuristic.
+    Search stops when the time budget is finished and the best move of the last completed depth is returned.
+    """
+    name = "alphabeta"
+    win_score = 10 ** 12  # Bigger than any score of evaluator.
+
+    def __init__(self, time_limit: float = 0.5, max_depth: int | None = None, evaluator=None, distance: int = 1):
+        """
+        Initializes AlphaBetaStrategy class.
+        :param time_limit: Maximum seconds that search of a move can take.
+        :param max_depth: Maximum depth of search. Search goes until the end of the game when it is None.
+        :param evaluator: An object with evaluate(board, mover, opponent) method. LineEvaluator is used when it is None.
+        :param distance: Only positions within this distance of existing markers are tried.
+        """
+        self.__time_limit = time_limit
+        self.__max_depth = max_depth
+        self.__evaluator = evaluator if evaluator is not None else LineEvaluator()
+        self.__distance = distance
+        self.__board = None
+        self.__neighbours = ()
+        self.__deadline = 0.0
+        self.__nodes = 0
+        self.__table = {}
+        self.__keys = ((), ())
+        self.__killers = []
+        self.__history = []
+
+    # Determines number of positions which were searched for the last move.
+    @property
+    def nodes(self) -> int:
+        return self.__nodes
+
+    def choose_move(self, board: Board, player_marker: PlayerMarker) -> int | None:
+        """
+        Chooses the best move of player that is found within the time budget.
+        :param board: Current board of the game.
+        :param player_marker: Determines player (X or O) who should move.
+        :return: Selected position on board. It returns None when board is full.
+        """
+        self.__deadline = time.perf_counter() + self.__time_limit
+        other_marker = player_marker.opponent
+        empty = board.full_mask & ~board.occupied
+        if not empty:
+            return None
+        # Winning immediately and blocking the opponent do not need any search.
+        position = board.get_winning_move(player_marker)
+        if position is None:
+            position = board.get_winning_move(other_marker)
+        if position is not None:
+            return position
+        mover = board.bitboard(player_marker)
+        opponent = board.bitboard(other_marker)
+        self.__board = board
+        self.__neighbours = Board.get_neighbour_masks(board.width, board.height, self.__distance)
+        self.__nodes = 0
+        self.__table = {}
+        self.__history = [0] * (board.width * board.height)
+        # Zobrist keys of mover and opponent; positions are keyed by hash of board which is updated by every move.
+        cross_keys, circle_keys = Board.get_zobrist_keys(board.width, board.height)
+        self.__keys = (cross_keys, circle_keys) if player_marker == PlayerMarker.Cross else (circle_keys, cross_keys)
+        candidates = self.__candidates(mover | opponent) or board.full_mask & ~board.occupied
+        moves = self.__order(candidates, None, ())
+        best_move = moves[0]
+        max_depth = empty.bit_count() if self.__max_depth is None else min(self.__max_depth, empty.bit_count())
+        try:
+            for depth in range(1, max_depth + 1):
+                self.__killers = [[] for _ in range(depth + 1)]
+                best_move, value = self.__search_root(board, mover, opponent, moves, candidates, depth)
+                if abs(value) >= AlphaBetaStrategy.win_score - board.width * board.height:
+                    break  # Result of the game is already known.
+                # Next iteration starts with the best move of this one.
+                moves.remove(best_move)
+                moves.insert(0, best_move)
+        except _SearchTimeout:
+            pass
+        finally:
+            self.__board = None
+            self.__table = {}
+        return best_move
+
+    def __candidates(self, occupied: int) -> int:
+        # Gets mask of unoccupied positions near occupied ones.
+        candidates = 0
+        neighbours = self.__neighbours
+        bits = occupied
+        while bits:
+            bit = bits & -bits
+            bits ^= bit
+            candidates |= neighbours[bit.bit_length() - 1]
+        return candidates & ~occupied
+
+    def __order(self, candidates: int, table_move: int | None, killers) -> list:
+        # Orders moves: move of transposition table, killer moves and then by history score.
+        history = self.__history
+        moves = []
+        while candidates:
+            bit = candidates & -candidates
+            candidates ^= bit
+            moves.append(bit.bit_length() - 1)
+        moves.sort(key=lambda m: (m == table_move, m in killers, history[m]), reverse=True)
+        return moves
+
+    def __search_root(self, board: Board, mover: int, opponent: int, moves: list, candidates: int,
+                      depth: int) -> tuple:
+        alpha = -AlphaBetaStrategy.win_score - 1
+        best_move = moves[0]
+        for move in moves:
+            bit = 1 << move
+            child_candidates = (candidates | self.__neighbours[move]) & ~(mover | opponent | bit)
+            value = -self.__search(opponent, mover | bit, board.hash ^ self.__keys[0][move], move, child_candidates,
+                                   depth - 1, -AlphaBetaStrategy.win_score - 1, -alpha, 1)
+            if value > alpha:
+                alpha = value
+                best_move = move
+        return best_move, alpha
+
+    def __search(self, mover: int, opponent: int, key: int, last_move: int, candidates: int, depth: int,
+                 alpha: int, beta: int, ply: int) -> int:
+        # Negamax search with alpha-beta pruning. Values are from the point of view of mover.
+        # Key is Zobrist hash of the position; mover of the root moves on even plies.
+        self.__nodes += 1
+        if not self.__nodes & 63 and time.perf_counter() > self.__deadline:
+            raise _SearchTimeout()
+        board = self.__board
+        if board.makes_row(opponent, last_move):
+            return -(AlphaBetaStrategy.win_score - ply)
+        occupied = mover | opponent
+        if not candidates:
+            # Every position near markers is occupied; any unoccupied position can be tried.
+            candidates = board.full_mask & ~occupied
+            if not candidates:
+                return 0
+        if depth == 0:
+            return self.__evaluator.evaluate(board, mover, opponent)
+        entry = self.__table.get(key)
+        table_move = None
+        if entry is not None:
+            entry_depth, entry_value, entry_flag, table_move = entry
+            if entry_depth >= depth:
+                if entry_flag == 0:
+                    return entry_value
+                if entry_flag < 0 and entry_value <= alpha or entry_flag > 0 and entry_value >= beta:
+                    return entry_value
+        original_alpha = alpha
+        killers = self.__killers[ply] if ply < len(self.__killers) else ()
+        best_value = -AlphaBetaStrategy.win_score - 1
+        best_move = None
+        mover_keys = self.__keys[ply & 1]
+        for move in self.__order(candidates, table_move, killers):
+            bit = 1 << move
+            child_candidates = (candidates | self.__neighbours[move]) & ~(occupied | bit)
+            value = -self.__search(opponent, mover | bit, key ^ mover_keys[move], move, child_candidates, depth - 1,
+                                   -beta, -alpha, ply + 1)
+            if value > best_value:
+                best_value = value
+                best_move = move
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                # Move caused a cutoff; remember it for ordering moves of other positions.
+                if move not in killers:
+                    killers.insert(0, move)
+                    del killers[2:]
+                self.__history[move] += depth * depth
+                break
+        # Flag of entry: 0 => exact value, -1 => upper bound, 1 => lower bound
+        flag = -1 if best_value <= original_alpha else 1 if best_value >= beta else 0
+        self.__table[key] = (depth, best_value, flag, best_move)
+        return best_value
+
+
+class TablebaseStrategy(Strategy):
+    """
+    Determines a strategy which never loses on 3x3 board by reading best moves from the precomputed Tablebase.
+    Every move is a single indexed read of the memory-mapped tablebase file.
+    """
+    name = "tablebase"
+
+    def __init__(self, tablebase: Tablebase | None = None):
+        """
+        Initializes TablebaseStrategy class.
+        :param tablebase: Tablebase to read moves from. Tablebase at its default path is used when it is None.
+        """
+        self.__tablebase = tablebase if tablebase is not None else Tablebase()
+
+    def choose_move(self, board: Board, player_marker: PlayerMarker) -> int | None:
+        """
+        Chooses one of the best moves of player.
+        :param board: Current board of the game.
+        :param player_marker: Determines player (X or O) who should move.
+        :return: Selected position on board. It returns None when game is finished.
+        """
+        if (board.width, board.height, board.win_length) != (3, 3, 3):
+            raise ValueError("TablebaseStrategy only supports 3x3 boards.")
+        other_marker = player_marker.opponent
+        best_moves = self.__tablebase.lookup(board.bitboard(player_marker), board.bitboard(other_marker))[2]
+        if not best_moves:
+            return None
+        return random.choice([position for position in range(9) if best_moves >> position & 1])
+
+
+def _mcts_search(task: tuple) -> tuple:
+    """
+    Grows one UCT tree from a position with random playouts. MCTSStrategy runs one call per process.
+    Nodes are stored in parallel arrays indexed by node number (node 0 is the root) and children of a node are
+    contiguous, so a node takes 21 bytes (2 + 4 + 2 + 4 + 8 + 1) instead of a Python object.
+    :param task: (width, height, win length, mover, opponent, iterations, time limit, exploration, distance,
+    maximum number of nodes, seed)
+    :return: (moves of root, visits of each move, number of iterations)
+    """
+    width, height, win_length, mover, opponent, iterations, time_limit, exploration, distance, max_nodes, seed = task
+    rng = random.Random(seed)
+    makes_row = Board(width, height, win_length).makes_row
+    full_mask = (1 << width * height) - 1
+    neighbours = Board.get_neighbour_masks(width, height, distance)
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    log, sqrt = math.log, math.sqrt
+
+    moves = array.array("h", [-1])  # Move which leads to node.
+    first_child = array.array("i", [-1])  # -1 => node is not expanded.
+    child_count = array.array("h", [0])
+    visits = array.array("i", [0])
+    wins = array.array("d", [0.0])  # From point of view of the player who moved into node; a tie is half a win.
+    # 0 => game continues, 1 => the player who moved into node won, 2 => board is full
+    terminal = array.array("b", [0])
+
+    iteration = 0
+    while iteration != iterations:
+        if deadline is not None and iteration % 64 == 0 and time.perf_counter() >= deadline:
+            break
+        iteration += 1
+        # Selection; current is bitboard of the player who should move at node and other of the one who moved into it.
+        node, current, other = 0, mover, opponent
+        path = [0]
+        while first_child[node] >= 0 and not terminal[node]:
+            start = first_child[node]
+            parent_log = log(visits[node])
+            best_child, best_score = start, -1.0
+            for child in range(start, start + child_count[node]):
+                count = visits[child]
+                if not count:
+                    best_child = child
+                    break
+                score = wins[child] / count + exploration * sqrt(parent_log / count)
+                if score > best_score:
+                    best_child, best_score = child, score
+            node = best_child
+            current, other = other, current | 1 << moves[node]
+            path.append(node)
+
+        # Expansion; all children of a node are added at once when it is visited for the second time.
+        if not terminal[node] and (visits[node] or not node) and len(moves) < max_nodes:
+            occupied = current | other
+            candidates = 0
+            bits = occupied
+            while bits:
+                bit = bits & -bits
+                bits ^= bit
+                candidates |= neighbours[bit.bit_length() - 1]
+            candidates = candidates & ~occupied or full_mask & ~occupied
+            first_child[node] = len(moves)
+            while candidates:
+                bit = candidates & -candidates
+                candidates ^= bit
+                move = bit.bit_length() - 1
+                selected = current | bit
+                moves.append(move)
+                first_child.append(-1)
+                child_count.append(0)
+                visits.append(0)
+                wins.append(0.0)
+                terminal.append(1 if makes_row(selected, move) else 2 if selected | other == full_mask else 0)
+            child_count[node] = len(moves) - first_child[node]
+            node = rng.randrange(first_child[node], len(moves))
+            current, other = other, current | 1 << moves[node]
+            path.append(node)
+
+        # Simulation; reward is for the player who moved into node.
+        if terminal[node]:
+            reward = 1.0 if terminal[node] == 1 else 0.5
+        else:
+            bitboards = [current, other]
+            empty = [i for i in range(width * height) if not (current | other) >> i & 1]
+            rng.shuffle(empty)
+            reward = 0.5
+            turn = 0
+            for move in empty:
+                bitboards[turn] |= 1 << move
+                if makes_row(bitboards[turn], move):
+                    reward = 1.0 if turn else 0.0
+                    break
+                turn ^= 1
+
+        # Backpropagation
+        for node in reversed(path):
+            visits[node] += 1
+            wins[node] += reward
+            reward = 1.0 - reward
+
+    start = first_child[0]
+    children = range(start, start + child_count[0]) if start >= 0 else range(0)
+    return tuple(moves[child] for child in children), tuple(visits[child] for child in children), iteration
+
+
+class MCTSStrategy(Strategy):
+    """
+    Determines a strategy for boards of any size which uses Monte Carlo Tree Search (UCT) with random playouts.
+    Search is parallelized at the root: every process grows an independent tree and visits of moves of the roots are
+    added up, so strength grows with the number of processes. The move with the most visits is chosen.
+    """
+    name = "mcts"
+
+    def __init__(self, iterations: int | None = 5000, time_limit: float | None = 1.0, processes: int = 1,
+                 exploration: float = 1.4, distance: int = 1, max_nodes: int = 1000000):
+        """
+        Initializes MCTSStrategy class.
+        :param iterations: Maximum number of playouts of each tree for a move; it should be positive. There is no limit when
+        it is None.
+        :param time_limit: Maximum seconds that search of a move can take. There is no limit when it is None.
+        :param processes: Number of trees which are grown in parallel. A process pool is started on the first move
+        when it is more than 1; call close when strategy is not needed anymore.
+        :param exploration: Exploration constant of UCT.
+        :param distance: Only positions within this distance of existing markers are tried.
+        :param max_nodes: Maximum number of nodes of each tree; after that, leaves are not expanded anymore.
+        """
+        if iterations is None and time_limit is None:
+            raise ValueError("Iterations or time limit should be given.")
+        if iterations is not None and iterations <= 0:
+            raise ValueError("Iterations should be positive.")
+        self.__iterations = iterations
+        self.__time_limit = time_limit
+        self.__processes = processes
+        self.__exploration = exploration
+        self.__distance = distance
+        self.__max_nodes = max_nodes
+        self.__pool = None
+        self.__playouts = 0
+
+    # Determines number of playouts (of all trees) for the last move.
+    @property
+    def playouts(self) -> int:
+        return self.__playouts
+
+    def choose_move(self, board: Board, player_marker: PlayerMarker) -> int | None:
+        """
+        Chooses the most visited move of player after the search budget is finished.
+        :param board: Current board of the game.
+        :param player_marker: Determines player (X or O) who should move.
+        :return: Selected position on board. It returns None when board is full.
+        """
+        if board.is_full:
+            return None
+        # Winning immediately and blocking the opponent do not need any search.
+        position = board.get_winning_move(player_marker)
+        if position is None:
+            position = board.get_winning_move(player_marker.opponent)
+        if position is not None:
+            return position
+        tasks = [(board.width, board.height, board.win_length, board.bitboard(player_marker),
+                  board.bitboard(player_marker.opponent), self.__iterations, self.__time_limit, self.__exploration,
+                  self.__distance, self.__max_nodes, random.getrandbits(64)) for _ in range(self.__processes)]
+        if self.__processes > 1:
+            if self.__pool is None:
+                self.__pool = multiprocessing.Pool(self.__processes)
+            results = self.__pool.map(_mcts_search, tasks)
+        else:
+            results = [_mcts_search(tasks[0])]
+        visits = {}
+        self.__playouts = 0
+        for moves, counts, iterations in results:
+            self.__playouts += iterations
+            for move, count in zip(moves, counts):
+                visits[move] = visits.get(move, 0) + count
+        if not visits:
+            # Time limit was over before any playout; a center or any unoccupied position is still a legal move.
+            return random.choice(board.check_unoccupied_places(*board.centers) or
+                                 board.check_unoccupied_places(*board.places))
+        return max(visits, key=visits.get)
+
+    def close(self) -> None:
+        """
+        Stops the process pool of strategy.
+        :return: None
+        """
+        if self.__pool is not None:
+            self.__pool.terminate()
+            self.__pool = None
+
+
+class PonderingStrategy(Strategy):
+    """
+    Wraps another strategy and remembers its moves by Zobrist hash of board, so a position is only searched once.
+    While opponent is thinking, ponder searches the replies to the possible moves of opponent in advance, so when
+    opponent moves the reply is usually read from the cache. The cache is kept across turns and games.
+    """
+
+    def __init__(self, strategy: Strategy, max_entries: int = 100000):
+        """
+        Initializes PonderingStrategy class.
+        :param strategy: The strategy which moves are chosen by.
+        :param max_entries: Maximum number of positions in cache; cache is cleared when it is full.
+        """
+        self.__strategy = strategy
+        self.__max_entries = max_entries
+        self.__cache = {}
+        self.__hits = 0
+        self.__misses = 0
+
+    # Determines name of the wrapped strategy.
+    @property
+    def name(self) -> str:
+        return self.__strategy.name
+
+    # Determines the wrapped strategy.
+    @property
+    def strategy(self) -> Strategy:
+        return self.__strategy
+
+    # Determines number of moves which were read from cache.
+    @property
+    def hits(self) -> int:
+        return self.__hits
+
+    # Determines number of moves which needed a search.
+    @property
+    def misses(self) -> int:
+        return self.__misses
+
+    def choose_move(self, board: Board, player_marker: PlayerMarker) -> int | None:
+        """
+        Chooses the move of the wrapped strategy, from cache when the position was searched before.
+        :param board: Current board of the game.
+        :param player_marker: Determines player (X or O) who should move.
+        :return: Selected position on board. It returns None when there is no move.
+        """
+        key = (board.hash, player_marker)
+        position = self.__cache.get(key)
+        if position is not None:
+            self.__hits += 1
+            return position
+        self.__misses += 1
+        return self.__search(board, player_marker, key)
+
+    def ponder(self, board: Board, player_marker: PlayerMarker, should_stop=None) -> int:
+        """
+        Searches the replies of player to every possible move of opponent, the most likely moves first.
+        :param board: Current board of the game, when opponent should move. It is the same after pondering.
+        :param player_marker: Determines player (X or O) who replies.
+        :param should_stop: Function which is called between searches; pondering stops when it returns True.
+        :return: Number of replies which were searched.
+        """
+        opponent_marker = player_marker.opponent
+        searched = 0
+        for position in self.__likely_moves(board, opponent_marker):
+            if should_stop is not None and should_stop():
+                break
+            board.make_move(position, opponent_marker)
+            if not board.check_winner(opponent_marker) and not board.is_full:
+                key = (board.hash, player_marker)
+                if key not in self.__cache:
+                    self.__search(board, player_marker, key)
+                    searched += 1
+            board.unmake_move()
+        return searched
+
+    def __search(self, board: Board, player_marker: PlayerMarker, key: tuple) -> int | None:
+        position = self.__strategy.choose_move(board, player_marker)
+        if position is not None:
+            if len(self.__cache) >= self.__max_entries:
+                self.__cache.clear()
+            self.__cache[key] = position
+        return position
+
+    @staticmethod
+    def __likely_moves(board: Board, player_marker: PlayerMarker) -> list:
+        # Orders unoccupied positions: winning move, block of the winning move of the other player, positions next
+        # to markers and then the others.
+        neighbours = Board.get_neighbour_masks(board.width, board.height, 1)
+        near = 0
+        for position in board.get_selected_places(player_marker) + board.get_selected_places(player_marker.opponent):
+            near |= neighbours[position]
+        moves = sorted(board.check_unoccupied_places(*board.places), key=lambda m: not near >> m & 1)
+        for forced in (board.get_winning_move(player_marker.opponent), board.get_winning_move(player_marker)):
+            if forced is not None:
+                moves.remove(forced)
+                moves.insert(0, forced)
+        return moves
+
+
+# Built-in strategies which can be chosen by name (e.g. in command line tools).
+STRATEGIES = {
+    "rules": RuleBasedStrategy,
+    "random": RandomStrategy,
+    "perfect": PerfectStrategy,
+    "alphabeta": AlphaBetaStrategy,
+    "tablebase": TablebaseStrategy,
+    "mcts": MCTSStrategy,
+}
@@ -0,0 +1,144 @@
+from Models.CoreModels import *
+import mmap
+import os
+import struct
+import tempfile
+
+DEFAULT_TABLEBASE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tablebase.bin")
+
+
+class Tablebase:
+    """
+    Determines the precomputed 3x3 tablebase.
+    Every position has an entry at index sum(3 ** i * cell i), where a cell is 0 (empty), 1 (marker of the player who
+    should move) or 2 (marker of the other player), so games that X or O started are both covered.
+    An entry is a little-endian 16-bit integer:
+        bits 0-1: value for the player who should move (0 => unreachable or finished, 1 => loss, 2 => tie, 3 => win)
+        bits 2-5: number of moves until end of the game with perfect play
+        bits 6-14: bitmask of the best moves
+    The file is memory-mapped on first use, so nothing is built at import time.
+    """
+    header = struct.Struct("<4sBxxx")
+    magic = b"TTTB"
+    version = 1
+    entries = 3 ** 9
+    entry = struct.Struct("<H")
+    Unknown, Loss, Tie, Win = 0, 1, 2, 3
+    # ternary[bits] is sum(3 ** i) for the set bits i of a 9-bit bitboard.
+    ternary = tuple(sum(3 ** i for i in range(9) if bits >> i & 1) for bits in range(1 << 9))
+
+    def __init__(self, path: str = DEFAULT_TABLEBASE_PATH):
+        """
+        Initializes Tablebase class. File is not opened until the first lookup.
+        :param path: Path of tablebase file. It is generated on first use when it does not exist.
+        """
+        self.__path = path
+        self.__map = None
+
+    @staticmethod
+    def index(mover: int, opponent: int) -> int:
+        """
+        Gets index of a position in tablebase.
+        :param mover: Bitboard of the player who should move.
+        :param opponent: Bitboard of the other player.
+        """
+        return Tablebase.ternary[mover] + 2 * Tablebase.ternary[opponent]
+
+    def lookup(self, mover: int, opponent: int) -> tuple:
+        """
+        Reads entry of a position with a single indexed read.
+        :param mover: Bitboard of the player who should move.
+        :param opponent: Bitboard of the other player.
+        :return: (value, distance to end, bitmask of best moves)
+        """
+        if self.__map is None:
+            self.__open()
+        offset = Tablebase.header.size + 2 * Tablebase.index(mover, opponent)
+        entry = Tablebase.entry.unpack_from(self.__map, offset)[0]
+        return entry & 3, entry >> 2 & 0xF, entry >> 6
+
+    def __open(self) -> None:
+        if not os.path.exists(self.__path):
+            Tablebase.generate(self.__path)
+        with open(self.__path, "rb") as file:
+            self.__map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = Tablebase.header.unpack_from(self.__map)
+        if magic != Tablebase.magic or version != Tablebase.version or \
+                len(self.__map) != Tablebase.header.size + 2 * Tablebase.entries:
+            self.__map.close()
+            self.__map = None
+            raise ValueError(f"{self.__path} is not a tablebase.")
+
+    @staticmethod
+    def generate(path: str = DEFAULT_TABLEBASE_PATH) -> int:
+        """
+        Generates tablebase file by retrograde analysis of every reachable position.
+        Positions are found by playing forward from the empty board, then solved from full boards back to the empty
+        one, so every position is solved after all of its successors.
+        :param path: Path of tablebase file. File is replaced atomically.
+        :return: Number of reachable positions.
+        """
+        wining_masks = tuple(sum(1 << i for i in case) for case in Board.get_wining_cases(3, 3, 3))
+
+        def has_won(bits: int) -> bool:
+            for mask in wining_masks:
+                if bits & mask == mask:
+                    return True
+            return False
+
+        # layers[n] holds reachable positions (mover, opponent) with n markers.
+        layers = [set() for _ in range(10)]
+        layers[0].add((0, 0))
+        for count in range(9):
+            for mover, opponent in layers[count]:
+                if has_won(opponent):
+                    continue  # Game is finished.
+                empty = 0x1FF & ~(mover | opponent)
+                for position in range(9):
+                    if empty >> position & 1:
+                        layers[count + 1].add((opponent, mover | 1 << position))
+
+        entries = [0] * Tablebase.entries
+        # Results of positions: (value, distance) for the player who should move.
+        results = {}
+        for count in range(9, -1, -1):
+            for mover, opponent in layers[count]:
+                empty = 0x1FF & ~(mover | opponent)
+                if has_won(opponent):
+                    results[mover, opponent] = (Tablebase.Loss, 0)
+                    continue
+                if not empty:
+                    results[mover, opponent] = (Tablebase.Tie, 0)
+                    continue
+                best_key = None
+                best_moves = 0
+                for position in range(9):
+                    if not empty >> position & 1:
+                        continue
+                    child_value, child_distance = results[opponent, mover | 1 << position]
+                    value = Tablebase.Win + Tablebase.Loss - child_value
+                    # Wins should be fast and losses should be slow.
+                    key = (value, -child_distance if value == Tablebase.Win else child_distance)
+                    if best_key is None or key > best_key:
+                        best_key = key
+                        best_moves = 1 << position
+                    elif key == best_key:
+                        best_moves |= 1 << position
+                value = best_key[0]
+                distance = abs(best_key[1]) + 1
+                results[mover, opponent] = (value, distance)
+                entries[Tablebase.index(mover, opponent)] = value | distance << 2 | best_moves << 6
+
+        # Every process writes its own temporary file, so processes which generate at the same time do not clash.
+        descriptor, temporary = tempfile.mkstemp(prefix=os.path.basename(path) + ".",
+                                                 dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(Tablebase.header.pack(Tablebase.magic, Tablebase.version))
+                file.write(struct.pack(f"<{Tablebase.entries}H", *entries))
+            os.chmod(temporary, 0o644)  # mkstemp makes files which only the owner can read.
+            os.replace(temporary, path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+        return len(results)
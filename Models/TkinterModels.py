@@ -51,39 +51,39 @@ class GameBoardFrame(tk.Frame):
     Tkinter Frame for Game Board.
     """
 
-    def __init__(self, main_layout: MainLayout):
+    def __init__(self, main_layout: MainLayout, width: int = 3, height: int = 3, on_click=None):
         """
         Initializes GameBoardFrame class.
         Creates needed widgets for GameBoard.
         :param master: tkinter root window.
-        :param marker: marker that should be shown in place of clicked button.
+        :param width: Number of columns of board.
+        :param height: Number of rows of board.
+        :param on_click: Function which is called with number of button whenever user made a move.
         """
         super().__init__(main_layout)
+        self.__on_click_callback = on_click
         self.pack()  # Packs frame to root windows.
         self.__marker = PlayerMarker.Unspecified  # Creates private attribute for marker property.
         self.__last_clicked_button = None  # Creates private attribute for last_clicked_button property.
         self.__status = GameStatus.Starting
+        self.__locked = False  # Creates private attribute for locked property.
         # Creates text variables for buttons.
         self.__string_vars = {}
-        for i in range(0, 9):
+        for i in range(0, width * height):
             self.__string_vars[f"b{i}_string"] = tk.StringVar()
             self.__string_vars[f"b{i}_string"].set("")
-        # Creates 9 buttons and configures their properties.
+        # Creates a button for each position of board and configures their properties.
+        # Buttons get smaller on boards which are bigger than 3x3.
+        small = width > 3 or height > 3
         self.__buttons = {}
-        for i in range(0, 9):
+        for i in range(0, width * height):
             self.__buttons[f"b{i}"] = tk.Button(self, textvariable=self.__string_vars[f"b{i}_string"],
-                                                command=lambda n=i: self.__on_click(n), height=4,
-                                                width=8, font="Helvetica 20", state="normal")
-        # Configures geometry of buttons.
-        self.__buttons["b0"].grid(row=1, column=0)
-        self.__buttons["b1"].grid(row=1, column=1)
-        self.__buttons["b2"].grid(row=1, column=2)
-        self.__buttons["b3"].grid(row=2, column=0)
-        self.__buttons["b4"].grid(row=2, column=1)
-        self.__buttons["b5"].grid(row=2, column=2)
-        self.__buttons["b6"].grid(row=3, column=0)
-        self.__buttons["b7"].grid(row=3, column=1)
-        self.__buttons["b8"].grid(row=3, column=2)
+                                                command=lambda n=i: self.__on_click(n), height=1 if small else 4,
+                                                width=2 if small else 8,
+                                                font="Helvetica 12" if small else "Helvetica 20", state="normal")
+            # Configures geometry of button.
+            self.__buttons[f"b{i}"].grid(row=1 + i // width, column=i % width)
+        self.__default_background = self.__buttons["b0"]['bg']
 
     # Determines number of last button that user clicked on.
     @property
@@ -94,6 +94,15 @@ class GameBoardFrame(tk.Frame):
     def last_clicked_button(self, button_number: int | None):
         self.__last_clicked_button = button_number
 
+    # Determines that if clicks are ignored (e.g. while computer is thinking).
+    @property
+    def locked(self):
+        return self.__locked
+
+    @locked.setter
+    def locked(self, locked: bool):
+        self.__locked = locked
+
     # Determines the marker that should be shown in place of clicked button.
     @property
     def marker(self):
@@ -109,11 +118,19 @@ class GameBoardFrame(tk.Frame):
 
     @status.setter
     def status(self, status: GameStatus):
+        if status == self.__status:
+            return  # Nothing changed; widgets are already up to date.
         if status != GameStatus.InProgress and status != GameStatus.Starting:
             # Changes state of all buttons to disable.
             # Used for the situation that game is finished
             for i in self.__buttons:
                 self.__buttons[i]['state'] = 'disabled'
+        elif status == GameStatus.InProgress and self.__status != GameStatus.Starting:
+            # Game is in progress again after moves of a finished game were taken back.
+            for i in range(len(self.__buttons)):
+                if not self.__string_vars[f"b{i}_string"].get():
+                    self.__buttons[f"b{i}"]['state'] = 'normal'
+                self.__buttons[f"b{i}"]['bg'] = self.__default_background
         self.__status = status
 
     def insert_marker(self, button_number: int | None, marker: PlayerMarker) -> None:
@@ -132,6 +149,40 @@ class GameBoardFrame(tk.Frame):
             elif marker == PlayerMarker.Circle:
                 self.__buttons[f"b{button_number}"]['disabledforeground'] = 'blue'
 
+    def remove_marker(self, button_number: int) -> None:
+        """
+        Clears a button when its move was taken back.
+        :param button_number: Number of button that its marker should be removed.
+        :return: None
+        """
+        self.__string_vars[f"b{button_number}_string"].set("")
+        if self.__status == GameStatus.InProgress:
+            self.__buttons[f"b{button_number}"]["state"] = "normal"
+
+    def highlight(self, button_numbers) -> None:
+        """
+        Highlights buttons (e.g. the winning line).
+        :param button_numbers: Numbers of buttons which should be highlighted.
+        :return: None
+        """
+        for button_number in button_numbers:
+            self.__buttons[f"b{button_number}"]['bg'] = 'yellow'
+
+    def reset(self) -> None:
+        """
+        Clears all buttons for a new game, reusing the existing widgets.
+        :return: None
+        """
+        for i in self.__string_vars:
+            self.__string_vars[i].set("")
+        for i in self.__buttons:
+            self.__buttons[i]['state'] = 'normal'
+            self.__buttons[i]['bg'] = self.__default_background
+        self.__marker = PlayerMarker.Unspecified
+        self.__last_clicked_button = None
+        self.__status = GameStatus.Starting
+        self.__locked = False
+
     def __on_click(self, button_number: int) -> None:
         """
         Callback method for click event.
@@ -139,9 +190,166 @@ class GameBoardFrame(tk.Frame):
         :param button_number: Number of button that user clicked on.
         :return: None
         """
+        if self.__locked:
+            return
+        if self.status == GameStatus.InProgress:
+            self.insert_marker(button_number, self.marker)
+            self.last_clicked_button = button_number
+            if self.__on_click_callback is not None:
+                self.__on_click_callback(button_number)
+        elif self.status == GameStatus.Starting:
+            MainLayout.show_warning("First choose your marker!")
+
+
+class GameBoardCanvas(tk.Canvas):
+    """
+    Tkinter Canvas for Game Board of any size.
+    Draws grid and markers as items of a single canvas instead of a button per position, and maps clicks to positions
+    by their coordinates. Only the items of a position which changed are drawn.
+    Has the same interface as GameBoardFrame.
+    """
+
+    def __init__(self, main_layout: MainLayout, width: int = 3, height: int = 3, on_click=None):
+        """
+        Initializes GameBoardCanvas class.
+        Draws grid of board.
+        :param master: tkinter root window.
+        :param width: Number of columns of board.
+        :param height: Number of rows of board.
+        :param on_click: Function which is called with number of position whenever user made a move.
+        """
+        self.__cell = max(24, min(100, 600 // max(width, height)))  # Size of each position in pixels.
+        super().__init__(main_layout, width=width * self.__cell + 1, height=height * self.__cell + 1, bg="white",
+                         highlightthickness=0)
+        self.pack(padx=5, pady=5)  # Packs canvas to root windows.
+        self.__columns = width
+        self.__rows = height
+        self.__on_click_callback = on_click
+        self.__marker = PlayerMarker.Unspecified  # Creates private attribute for marker property.
+        self.__last_clicked_button = None  # Creates private attribute for last_clicked_button property.
+        self.__status = GameStatus.Starting
+        self.__locked = False  # Creates private attribute for locked property.
+        self.__occupied = set()  # Positions that a marker is drawn on.
+        for column in range(width + 1):
+            self.create_line(column * self.__cell, 0, column * self.__cell, height * self.__cell, fill="gray")
+        for row in range(height + 1):
+            self.create_line(0, row * self.__cell, width * self.__cell, row * self.__cell, fill="gray")
+        self.bind("<Button-1>", self.__on_click)
+
+    # Determines number of last position that user clicked on.
+    @property
+    def last_clicked_button(self):
+        return self.__last_clicked_button
+
+    @last_clicked_button.setter
+    def last_clicked_button(self, button_number: int | None):
+        self.__last_clicked_button = button_number
+
+    # Determines that if clicks are ignored (e.g. while computer is thinking).
+    @property
+    def locked(self):
+        return self.__locked
+
+    @locked.setter
+    def locked(self, locked: bool):
+        self.__locked = locked
+
+    # Determines the marker that should be drawn in place of clicked position.
+    @property
+    def marker(self):
+        return self.__marker
+
+    @marker.setter
+    def marker(self, marker: PlayerMarker):
+        self.__marker = marker
+
+    # Clicks are ignored when game is not in progress, so changing status only removes the highlight of a finished
+    # game which its moves were taken back.
+    @property
+    def status(self):
+        return self.__status
+
+    @status.setter
+    def status(self, status: GameStatus):
+        if status == GameStatus.InProgress and self.__status not in (GameStatus.InProgress, GameStatus.Starting):
+            self.delete("highlight")
+        self.__status = status
+
+    def insert_marker(self, button_number: int | None, marker: PlayerMarker) -> None:
+        """
+        Draws marker on a position.
+        :param button_number: Number of position that marker should be drawn on.
+        :param marker: Determines the marker that should be drawn.
+        :return: None
+        """
+        if button_number is None or button_number in self.__occupied:
+            return
+        self.__occupied.add(button_number)
+        row, column = divmod(button_number, self.__columns)
+        padding = self.__cell // 5
+        x1, y1 = column * self.__cell + padding, row * self.__cell + padding
+        x2, y2 = (column + 1) * self.__cell - padding, (row + 1) * self.__cell - padding
+        tags = ("marker", f"p{button_number}")
+        line_width = max(2, self.__cell // 12)
+        if marker == PlayerMarker.Cross:
+            self.create_line(x1, y1, x2, y2, fill="red", width=line_width, tags=tags)
+            self.create_line(x1, y2, x2, y1, fill="red", width=line_width, tags=tags)
+        elif marker == PlayerMarker.Circle:
+            self.create_oval(x1, y1, x2, y2, outline="blue", width=line_width, tags=tags)
+
+    def remove_marker(self, button_number: int) -> None:
+        """
+        Removes marker of a position when its move was taken back.
+        :param button_number: Number of position that its marker should be removed.
+        :return: None
+        """
+        self.delete(f"p{button_number}")
+        self.__occupied.discard(button_number)
+
+    def highlight(self, button_numbers) -> None:
+        """
+        Highlights positions (e.g. the winning line).
+        :param button_numbers: Numbers of positions which should be highlighted.
+        :return: None
+        """
+        for button_number in button_numbers:
+            row, column = divmod(button_number, self.__columns)
+            self.create_rectangle(column * self.__cell + 1, row * self.__cell + 1, (column + 1) * self.__cell - 1,
+                                  (row + 1) * self.__cell - 1, fill="yellow", outline="", tags="highlight")
+        self.tag_raise("marker", "highlight")
+
+    def reset(self) -> None:
+        """
+        Removes all markers and highlights for a new game, keeping the grid.
+        :return: None
+        """
+        self.delete("marker", "highlight")
+        self.__occupied.clear()
+        self.__marker = PlayerMarker.Unspecified
+        self.__last_clicked_button = None
+        self.__status = GameStatus.Starting
+        self.__locked = False
+
+    def __on_click(self, event) -> None:
+        """
+        Callback method for click event. Maps coordinates of click to a position of board.
+        This method is private and cannot be accessed from outer.
+        :param event: tkinter event of click.
+        :return: None
+        """
+        column, row = event.x // self.__cell, event.y // self.__cell
+        if not (0 <= column < self.__columns and 0 <= row < self.__rows):
+            return
+        button_number = row * self.__columns + column
+        if self.__locked:
+            return
         if self.status == GameStatus.InProgress:
+            if button_number in self.__occupied:
+                return
             self.insert_marker(button_number, self.marker)
             self.last_clicked_button = button_number
+            if self.__on_click_callback is not None:
+                self.__on_click_callback(button_number)
         elif self.status == GameStatus.Starting:
             MainLayout.show_warning("First choose your marker!")
 
@@ -151,13 +359,15 @@ class MarkerDeterminerFrame(tk.Frame):
     Tkinter Frame for specifying User marker in Game.
     """
 
-    def __init__(self, main_layout: MainLayout):
+    def __init__(self, main_layout: MainLayout, on_click=None):
         """
         Initializes MarkerDeterminerFrame class.
         Creates needed widgets for MarkerDeterminer frame.
         :param master: tkinter root window.
+        :param on_click: Function which is called with the selected marker whenever user chose a marker.
         """
         super().__init__(main_layout)
+        self.__on_click_callback = on_click
 
         self.__selected_marker = None  # Creates private attribute for selected_marker property.
 
@@ -177,6 +387,21 @@ class MarkerDeterminerFrame(tk.Frame):
     def selected_marker(self):
         return self.__selected_marker
 
+    def show(self) -> None:
+        """
+        Shows the frame again for a new game.
+        :return: None
+        """
+        self.__selected_marker = None
+        self.pack(padx=10, pady=10)
+
+    def hide(self) -> None:
+        """
+        Hides the frame when user chose its marker. The frame is kept to be shown again for the next game.
+        :return: None
+        """
+        self.pack_forget()
+
     def __on_click(self, marker: PlayerMarker) -> None:
         """
         Callback method for click event.
@@ -185,6 +410,8 @@ class MarkerDeterminerFrame(tk.Frame):
         :return: None
         """
         self.__selected_marker = marker
+        if self.__on_click_callback is not None:
+            self.__on_click_callback(marker)
 
 
 class GameStatusFrame(tk.Frame):
@@ -192,13 +419,20 @@ class GameStatusFrame(tk.Frame):
     Tkinter Frame for showing status of Game.
     """
 
-    def __init__(self, main_layout: MainLayout):
+    def __init__(self, main_layout: MainLayout, on_play_again=None, on_undo=None, on_redo=None):
         """
         Initializes GameStatusFrame class.
         Creates needed widgets for GameStatus frame.
         :param master: Tkinter root window
+        :param on_play_again: Function which is called when user clicked on PlayAgain button.
+        The whole window is rebuilt by starter method of main_layout when it is None.
+        :param on_undo: Function which is called when user clicked on Undo button.
+        :param on_redo: Function which is called when user clicked on Redo button.
+        Undo and Redo buttons are only shown when both of them are given.
         """
         super().__init__(main_layout)
+        self.__main_layout = main_layout
+        self.__on_play_again_callback = on_play_again
         self.__status = GameStatus.Starting  # Creates private attribute for status property.
         self.__user_marker = tk.StringVar()  # Creates private attribute for user_marker property.
         self.__user_marker.set(f"User : {PlayerMarker.Unspecified.value}")
@@ -208,11 +442,19 @@ class GameStatusFrame(tk.Frame):
         self.__l1.pack(side="top", padx=5, pady=5)
         self.__l2 = tk.Label(self, textvariable=self.computer_marker)
         self.__l2.pack(side='top', padx=5, pady=5)
+        self.__thinking = False  # Creates private attribute for thinking property.
+        self.__thinking_label = tk.Label(self, text="Computer is thinking...", fg="gray")
         self.__quit_button = tk.Button(self, text="Quit", width=10, command=exit, fg="red")
         self.__quit_button.pack(side="left", padx=5, pady=5)
+        if on_undo is not None and on_redo is not None:
+            self.__undo_button = tk.Button(self, text="Undo", width=6, command=on_undo, state="disabled")
+            self.__undo_button.pack(side="left", padx=5, pady=5)
+            self.__redo_button = tk.Button(self, text="Redo", width=6, command=on_redo, state="disabled")
+            self.__redo_button.pack(side="left", padx=5, pady=5)
+        else:
+            self.__undo_button = self.__redo_button = None
         self.__play_again_button = tk.Button(self, text="PlayAgain", width=10,
-                                             command=lambda: [main_layout.destroy(), main_layout.starter_method()],
-                                             fg="green")
+                                             command=self.__on_play_again, fg="green")
 
     # Determines User marker in the game. 
     @property
@@ -237,13 +479,59 @@ class GameStatusFrame(tk.Frame):
     def status(self):
         return self.__status
 
+    # Determines that if computer is choosing its move; an indicator is shown meanwhile.
+    @property
+    def thinking(self):
+        return self.__thinking
+
+    @thinking.setter
+    def thinking(self, thinking: bool):
+        if thinking == self.__thinking:
+            return
+        if thinking:
+            self.__thinking_label.pack(side="top", padx=5, pady=5, after=self.__l2)
+        else:
+            self.__thinking_label.pack_forget()
+        self.__thinking = thinking
+
+    def set_history(self, can_undo: bool, can_redo: bool) -> None:
+        """
+        Enables or disables Undo and Redo buttons.
+        :param can_undo: Determines that if there is a move which can be taken back.
+        :param can_redo: Determines that if there is a taken back move which can be made again.
+        :return: None
+        """
+        if self.__undo_button is not None:
+            self.__undo_button['state'] = 'normal' if can_undo else 'disabled'
+            self.__redo_button['state'] = 'normal' if can_redo else 'disabled'
+
     # Used to make visible or invisible widgets when status changes.
     @status.setter
     def status(self, status: GameStatus):
+        if status == self.__status:
+            return  # Nothing changed; widgets are already up to date.
         if status == GameStatus.InProgress:
-            # Shows GameStatusFrame when game started.
+            # Shows GameStatusFrame when game started, or hides PlayAgain button when moves of a finished game were
+            # taken back.
+            self.__play_again_button.pack_forget()
             self.pack(padx=10, pady=10)
-        elif status != GameStatus.InProgress and status != GameStatus.Starting:
+        elif status == GameStatus.Starting:
+            # Hides GameStatusFrame and PlayAgain button when a new game is started in the same window.
+            self.__play_again_button.pack_forget()
+            self.pack_forget()
+        else:
             # Shows PlayAgain button when game was finished.
             self.__play_again_button.pack(side="right", padx=5, pady=5)
         self.__status = status
+
+    def __on_play_again(self) -> None:
+        """
+        Callback method for click event of PlayAgain button.
+        This method is private and cannot be accessed from outer.
+        :return: None
+        """
+        if self.__on_play_again_callback is not None:
+            self.__on_play_again_callback()
+        else:
+            self.__main_layout.destroy()
+            self.__main_layout.starter_method()
@@ -0,0 +1,122 @@
+from Models.CoreModels import *
+import copy
+import logging
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class MoveWorker:
+    """
+    Computes moves of ComputerPlayer on a background thread, so the thread of the user interface never waits for a
+    strategy. Results are put in a queue which the user interface polls.
+    Every request gets a new ticket; cancel makes the results of all earlier tickets be dropped, because a running
+    strategy cannot be interrupted.
+    While there is no request, the thread can ponder (search replies to the possible moves of opponent in advance).
+    """
+
+    def __init__(self):
+        """
+        Initializes MoveWorker class. Thread is started on the first request.
+        """
+        self.__requests = queue.Queue()
+        self.__results = queue.Queue()
+        self.__thread = None
+        self.__ticket = 0  # Ticket of the last request; results of other tickets are stale.
+        self.__pending = False
+
+    # Determines that if a requested move is not received yet.
+    @property
+    def is_busy(self) -> bool:
+        return self.__pending
+
+    def request(self, player: ComputerPlayer, board: Board) -> int:
+        """
+        Asks for a move of player. Player chooses its move on a copy of board, so board can be used meanwhile.
+        :param player: The ComputerPlayer who should move.
+        :param board: Current board of the game.
+        :return: Ticket of the request.
+        """
+        self.__start()
+        self.__ticket += 1
+        self.__pending = True
+        self.__requests.put((self.__ticket, player, copy.copy(board), False))
+        return self.__ticket
+
+    def ponder(self, player: ComputerPlayer, board: Board) -> None:
+        """
+        Lets player search its replies to the possible moves of its opponent until the next request or cancel.
+        Nothing is done when strategy of player cannot ponder (see PonderingStrategy).
+        :param player: The ComputerPlayer who replies to the next move.
+        :param board: Current board of the game, when opponent of player should move.
+        :return: None
+        """
+        if not hasattr(player.strategy, "ponder"):
+            return
+        self.__start()
+        self.__requests.put((self.__ticket, player, copy.copy(board), True))
+
+    def poll(self) -> tuple | None:
+        """
+        Gets the result of the last request without waiting.
+        :return: (ticket, position) when the move is ready, otherwise None. Error of strategy is raised here.
+        """
+        while True:
+            try:
+                ticket, position, error = self.__results.get_nowait()
+            except queue.Empty:
+                return None
+            if ticket != self.__ticket:
+                continue  # Result of a cancelled request.
+            self.__pending = False
+            if error is not None:
+                raise error
+            return ticket, position
+
+    def cancel(self) -> None:
+        """
+        Drops the result of the pending request and stops pondering (e.g. when game is reset).
+        :return: None
+        """
+        self.__ticket += 1
+        self.__pending = False
+
+    def close(self) -> None:
+        """
+        Cancels the pending request and stops the thread after its current move (e.g. when window is closed).
+        :return: None
+        """
+        self.cancel()
+        if self.__thread is not None:
+            self.__requests.put(None)
+            self.__thread = None
+
+    def __start(self) -> None:
+        # Starts the thread if it is not running.
+        if self.__thread is None or not self.__thread.is_alive():
+            self.__thread = threading.Thread(target=self.__run, name="MoveWorker", daemon=True)
+            self.__thread.start()
+
+    def __run(self) -> None:
+        # Body of worker thread; handles requests one by one until None is received.
+        while True:
+            request = self.__requests.get()
+            if request is None:
+                return
+            ticket, player, board, pondering = request
+            if ticket != self.__ticket:
+                continue  # Request was cancelled before it started.
+            if pondering:
+                # Pondering stops as soon as there is another request or it was cancelled. It only fills caches, so
+                # its errors do not stop the thread; the next request reports them if strategy keeps failing.
+                try:
+                    player.strategy.ponder(board, player.marker,
+                                           lambda: ticket != self.__ticket or not self.__requests.empty())
+                except Exception:
+                    logger.exception("pondering failed")
+                continue
+            try:
+                self.__results.put((ticket, player.make_a_move(board), None))
+            except Exception as error:
+                self.__results.put((ticket, None, error))
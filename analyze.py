@@ -0,0 +1,92 @@
+import argparse
+import random
+import time
+from Models.AnalysisModels import *
+from Models.StrategyModels import *
+
+
+def play_games(cross_strategy: str, circle_strategy: str, games: int, width: int, height: int,
+               win_length: int) -> Iterator[PlayedGame]:
+    """
+    Plays games between two strategies lazily. Cross starts the even games and Circle starts the odd ones.
+    :return: Generator of PlayedGame.
+    """
+    cross_player = ComputerPlayer(PlayerMarker.Cross, STRATEGIES[cross_strategy]())
+    circle_player = ComputerPlayer(PlayerMarker.Circle, STRATEGIES[circle_strategy]())
+    names = {cross_player: f"{cross_strategy} (X)", circle_player: f"{circle_strategy} (O)"}
+    for i in range(games):
+        players = (cross_player, circle_player) if i % 2 == 0 else (circle_player, cross_player)
+        engine = GameEngine(*players, width, height, win_length)
+        engine.play()
+        yield PlayedGame(engine.moves, names[players[0]], names[players[1]], players[0].marker)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Finds mistakes and blunders of players in finished games.")
+    parser.add_argument("log", nargs="?", help="game-record log to analyze (see TICTACTOE_RECORDS of main.py)")
+    parser.add_argument("--play", nargs=2, metavar=("CROSS", "CIRCLE"), choices=STRATEGIES,
+                        help="analyze new games between two strategies instead of a log")
+    parser.add_argument("-n", "--games", type=int, default=1000, help="number of games to play with --play")
+    parser.add_argument("--width", type=int, default=3, help="board size of --play games")
+    parser.add_argument("--height", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=3)
+    parser.add_argument("--depth", type=int, help="moves searched after each move (default: until end of game)")
+    parser.add_argument("--blunders", action="store_true", help="print every blunder and missed win or block")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if (args.log is None) == (args.play is None):
+        parser.error("either a log or --play should be given")
+    if args.play is not None:
+        board = Board(args.width, args.height, args.win_length)
+        for name in args.play:
+            try:
+                STRATEGIES[name]().choose_move(board, PlayerMarker.Cross)
+            except ValueError as error:
+                parser.error(f"{name}: {error}")
+
+    random.seed(args.seed)
+    reader = None
+    if args.log is not None:
+        reader = GameRecordReader(args.log)
+        width, height, win_length = reader.board_size
+        games = games_from_records(reader)
+    else:
+        width, height, win_length = args.width, args.height, args.win_length
+        games = play_games(*args.play, args.games, width, height, win_length)
+    evaluator = PositionEvaluator(args.depth)
+
+    def report(analyses):
+        # Prints flagged moves while analyses stream through.
+        for number, analysis in enumerate(analyses):
+            for move in analysis.moves:
+                if move.is_blunder or move.is_mistake or move.missed_win or move.missed_block:
+                    kinds = [kind for kind, flag in (("blunder", move.is_blunder), ("mistake", move.is_mistake),
+                                                     ("missed win", move.missed_win),
+                                                     ("missed block", move.missed_block)) if flag]
+                    print(f"game {number} move {move.ply + 1}: {move.player} played {move.position}, "
+                          f"best {move.best_position} ({', '.join(kinds)})")
+            yield analysis
+
+    start = time.perf_counter()
+    analyses = analyze_games(games, width, height, win_length, evaluator)
+    statistics = summarize(report(analyses) if args.blunders else analyses)
+    elapsed = time.perf_counter() - start
+    if reader is not None:
+        reader.close()
+
+    total = max((player_statistics.games for player_statistics in statistics.values()), default=0)
+    print(f"{'Player':<16} {'Games':>7} {'Won':>6} {'Lost':>6} {'Moves':>7} {'Accuracy':>9} {'Mistakes':>9} "
+          f"{'Blunders':>9} {'Missed wins':>12} {'Missed blocks':>14}")
+    for player, player_statistics in sorted(statistics.items()):
+        print(f"{player:<16} {player_statistics.games:>7} {player_statistics.wins:>6} {player_statistics.losses:>6} "
+              f"{player_statistics.moves:>7} {100 * player_statistics.accuracy:>8.2f}% {player_statistics.mistakes:>9} "
+              f"{player_statistics.blunders:>9} {player_statistics.missed_wins:>12} "
+              f"{player_statistics.missed_blocks:>14}")
+    lookups = evaluator.hits + evaluator.misses
+    print(f"Elapsed: {elapsed:.2f} s, about {total / elapsed if elapsed else 0:.0f} games per second, "
+          f"cache hits {100 * evaluator.hits / lookups if lookups else 0:.1f}%")
+
+
+# main function will run only if the file was run directly, and not imported.
+if __name__ == "__main__":
+    main()
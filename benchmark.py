@@ -0,0 +1,266 @@
+import argparse
+import copy
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from Models.StrategyModels import *
+
+SEED = 2024
+POSITIONS = 200  # Number of mid-game positions which board benchmarks run on.
+BENCHMARKS = {}  # Name of benchmark => function which prepares it.
+
+
+def benchmark(name: str):
+    """
+    Registers a function that prepares a benchmark.
+    The function should return (operation, number of measured calls in one run of operation).
+    :param name: Name of benchmark in results.
+    """
+    def register(function):
+        BENCHMARKS[name] = function
+        return function
+    return register
+
+
+def random_positions(count: int, width: int = 3, height: int = 3, win_length: int = 3) -> list:
+    """
+    Creates unfinished positions by playing random moves. Result only depends on SEED.
+    :return: List of Board objects.
+    """
+    rng = random.Random(SEED)
+    positions = []
+    while len(positions) < count:
+        board = Board(width, height, win_length)
+        places = list(board.places)
+        rng.shuffle(places)
+        for i, position in enumerate(places[:rng.randrange(len(places))]):
+            if i % 2 == 0:
+                board.update_board(x=position)
+            else:
+                board.update_board(o=position)
+            if board.check_winner(PlayerMarker.Cross) or board.check_winner(PlayerMarker.Circle):
+                break
+        else:
+            positions.append(board)
+    return positions
+
+
+def marker_to_move(board: Board) -> PlayerMarker:
+    cross = board.bitboard(PlayerMarker.Cross).bit_count()
+    circle = board.bitboard(PlayerMarker.Circle).bit_count()
+    return PlayerMarker.Cross if cross <= circle else PlayerMarker.Circle
+
+
+@benchmark("board.check_winner")
+def check_winner_benchmark():
+    boards = random_positions(POSITIONS)
+
+    def run():
+        for board in boards:
+            board.check_winner(PlayerMarker.Cross)
+            board.check_winner(PlayerMarker.Circle)
+    return run, 2 * len(boards)
+
+
+@benchmark("board.get_selected_places")
+def get_selected_places_benchmark():
+    boards = random_positions(POSITIONS)
+
+    def run():
+        for board in boards:
+            board.get_selected_places(PlayerMarker.Cross)
+    return run, len(boards)
+
+
+@benchmark("board.get_winning_move")
+def get_winning_move_benchmark():
+    boards = random_positions(POSITIONS)
+
+    def run():
+        for board in boards:
+            board.get_winning_move(PlayerMarker.Cross)
+    return run, len(boards)
+
+
+@benchmark("board.get_winning_move[15x15]")
+def get_winning_move_large_benchmark():
+    boards = random_positions(20, 15, 15, 5)
+
+    def run():
+        for board in boards:
+            board.get_winning_move(PlayerMarker.Cross)
+    return run, len(boards)
+
+
+@benchmark("board.copy")
+def copy_benchmark():
+    boards = random_positions(POSITIONS)
+
+    def run():
+        for board in boards:
+            copy.copy(board)
+    return run, len(boards)
+
+
+@benchmark("board.make_unmake")
+def make_unmake_benchmark():
+    # Cost of making a move and taking it back, which is included in the make_a_move benchmarks.
+    boards = random_positions(POSITIONS)
+    moves = [(board, board.check_unoccupied_places(*board.places)[0], marker_to_move(board)) for board in boards]
+
+    def run():
+        for board, position, marker in moves:
+            board.make_move(position, marker)
+            board.unmake_move()
+    return run, len(moves)
+
+
+def make_a_move_benchmark(strategy_factory):
+    boards = random_positions(POSITIONS)
+    players = [ComputerPlayer(marker_to_move(board), strategy_factory()) for board in boards]
+    pairs = list(zip(players, boards))
+
+    def run():
+        for player, board in pairs:
+            if player.make_a_move(board) is not None:
+                board.unmake_move()
+    return run, len(pairs)
+
+
+@benchmark("computer.make_a_move[rules]")
+def rules_benchmark():
+    return make_a_move_benchmark(lambda: None)
+
+
+@benchmark("computer.make_a_move[perfect]")
+def perfect_benchmark():
+    return make_a_move_benchmark(PerfectStrategy)
+
+
+@benchmark("computer.make_a_move[alphabeta]")
+def alpha_beta_benchmark():
+    return make_a_move_benchmark(lambda: AlphaBetaStrategy(time_limit=10))
+
+
+@benchmark("game.status")
+def game_status_benchmark():
+    # Needs a display; benchmark is skipped when tkinter cannot create a window.
+    from Models.GameModels import Game, MainLayout
+    main_layout = MainLayout(lambda: None)
+    MainLayout.show_info = staticmethod(lambda text: None)  # Message boxes would block the benchmark.
+    game = Game(main_layout)
+    game._Game__on_marker_selected(PlayerMarker.Cross)
+
+    def run():
+        for _ in range(100):
+            game.status
+    return run, 100
+
+
+def full_game_benchmark(cross_factory, circle_factory):
+    cross_player = ComputerPlayer(PlayerMarker.Cross, cross_factory())
+    circle_player = ComputerPlayer(PlayerMarker.Circle, circle_factory())
+
+    def run():
+        GameEngine(cross_player, circle_player).play()
+        GameEngine(circle_player, cross_player).play()
+    return run, 2
+
+
+@benchmark("engine.play[rules vs rules]")
+def rules_game_benchmark():
+    return full_game_benchmark(lambda: None, lambda: None)
+
+
+@benchmark("engine.play[perfect vs rules]")
+def perfect_game_benchmark():
+    return full_game_benchmark(PerfectStrategy, lambda: None)
+
+
+def measure(run, operations: int, rounds: int, min_time: float) -> dict:
+    """
+    Measures time of an operation.
+    Warms up first and finds how many times run should be called so a round takes at least min_time seconds.
+    :return: Result of benchmark; times are nanoseconds per operation.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        if time.perf_counter() - start >= min_time:
+            break
+        number *= 2
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        times.append((time.perf_counter() - start) * 1e9 / (number * operations))
+    return {"median_ns": statistics.median(times), "min_ns": min(times), "rounds_ns": times,
+            "operations_per_round": number * operations}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Compares results with a baseline.
+    :param threshold: Allowed slowdown as a fraction (0.1 => 10%).
+    :return: Names of benchmarks which are slower than baseline by more than threshold.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<36}{'baseline':>14}{'current':>14}{'change':>10}")
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        change = result["median_ns"] / base["median_ns"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<36}{base['median_ns']:>12.0f}ns{result['median_ns']:>12.0f}ns{change:>+9.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks board, computer player and full game hot paths.")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this text")
+    parser.add_argument("-r", "--rounds", type=int, default=7, help="number of measured rounds")
+    parser.add_argument("--min-time", type=float, default=0.1, help="minimum seconds of each round")
+    parser.add_argument("-o", "--output", help="file to save results as JSON")
+    parser.add_argument("-b", "--baseline", help="JSON results to compare with")
+    parser.add_argument("-t", "--threshold", type=float, default=0.1, help="allowed slowdown against baseline")
+    args = parser.parse_args()
+
+    results = {}
+    for name, prepare in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        random.seed(SEED)
+        try:
+            run, operations = prepare()
+        except Exception as error:  # e.g. tkinter.TclError when there is no display.
+            print(f"{name:<36}skipped: {error}")
+            continue
+        random.seed(SEED)
+        results[name] = measure(run, operations, args.rounds, args.min_time)
+        print(f"{name:<36}{results[name]['median_ns']:>12.0f} ns/op (min {results[name]['min_ns']:.0f})")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"python": sys.version, "platform": platform.platform(), "seed": SEED, "results": results},
+                      file, indent=2)
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+# main function will run only if the file was run directly, and not imported.
+if __name__ == "__main__":
+    main()
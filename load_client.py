@@ -0,0 +1,84 @@
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+
+async def run_client(host: str, port: int, path: str | None, games: int, size: tuple, latencies: list,
+                     results: dict, rng: random.Random) -> None:
+    """
+    Plays games against the server with random legal moves and records latency of each request.
+    """
+    if path is not None:
+        reader, writer = await asyncio.open_unix_connection(path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+
+    async def request(message: dict) -> dict:
+        start = time.perf_counter()
+        writer.write(json.dumps(message).encode() + b"\n")
+        await writer.drain()
+        line = await reader.readline()
+        latencies.append(time.perf_counter() - start)
+        if not line:
+            raise ConnectionError("Server closed the connection.")
+        return json.loads(line)
+
+    try:
+        for _ in range(games):
+            response = await request({"op": "new", "marker": rng.choice("XO"),
+                                      "starter": rng.choice(["user", "computer"]),
+                                      "width": size[0], "height": size[1], "win_length": size[2]})
+            while response.get("ok") and response["status"] == "InProgress":
+                free = [i for i, cell in enumerate(response["board"]) if cell == "."]
+                response = await request({"op": "move", "position": rng.choice(free)})
+            status = response["status"] if response.get("ok") else "Error"
+            results[status] = results.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+async def run(args) -> None:
+    latencies = []
+    results = {}
+    rng = random.Random(args.seed)
+    size = (args.width, args.height, args.win_length)
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(*(run_client(args.host, args.port, args.unix, args.games, size, latencies,
+                                                 results, random.Random(rng.random()))
+                                      for _ in range(args.clients)), return_exceptions=True)
+    elapsed = time.perf_counter() - start
+    errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+
+    print(f"Clients: {args.clients}, games: {sum(results.values())}, failed clients: {len(errors)}")
+    for status, count in sorted(results.items()):
+        print(f"{status:>12}: {count}")
+    if latencies:
+        latencies.sort()
+        print(f"Elapsed: {elapsed:.2f} s, {len(latencies) / elapsed:.0f} requests per second, "
+              f"{sum(results.values()) / elapsed:.0f} games per second")
+        print(f"Latency: p50 {statistics.median(latencies) * 1e3:.2f} ms, "
+              f"p99 {latencies[int(0.99 * (len(latencies) - 1))] * 1e3:.2f} ms, max {latencies[-1] * 1e3:.2f} ms")
+    if errors:
+        print(f"First error: {errors[0]!r}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generates load on server.py and reports throughput and latency.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="path of the Unix socket of server")
+    parser.add_argument("-c", "--clients", type=int, default=100, help="number of concurrent connections")
+    parser.add_argument("-n", "--games", type=int, default=10, help="number of games each client plays")
+    parser.add_argument("--width", type=int, default=3)
+    parser.add_argument("--height", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
+
+
+# main function will run only if the file was run directly, and not imported.
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,29 @@
 from Models.GameModels import *
 from Models.TkinterModels import *
+from Models.InstrumentationModels import *
+from Models.RecordModels import *
+from Models.StrategyModels import *
+import logging
+import os
 
 
 def main():
     main_layout = MainLayout(main)
-    app = Game(main_layout)
+    instrumentation = None
+    # Summary of each game is appended to the file which TICTACTOE_METRICS environment variable points to.
+    if os.environ.get("TICTACTOE_METRICS"):
+        logging.basicConfig(level=logging.INFO)
+        instrumentation = Instrumentation(os.environ["TICTACTOE_METRICS"])
+    recorder = None
+    # Every finished game is appended to the log which TICTACTOE_RECORDS environment variable points to.
+    if os.environ.get("TICTACTOE_RECORDS"):
+        recorder = GameRecordWriter(os.environ["TICTACTOE_RECORDS"])
+    strategy = None
+    # Computer uses the strategy which TICTACTOE_STRATEGY environment variable names (see STRATEGIES), and searches
+    # its replies while user is thinking.
+    if os.environ.get("TICTACTOE_STRATEGY"):
+        strategy = PonderingStrategy(STRATEGIES[os.environ["TICTACTOE_STRATEGY"]]())
+    app = Game(main_layout, instrumentation=instrumentation, recorder=recorder, strategy=strategy)
     app.play()
     main_layout.mainloop()
 
@@ -0,0 +1,82 @@
+import argparse
+import multiprocessing
+import os
+import random
+import time
+from Models.StrategyModels import *
+
+
+def play_games(task: tuple) -> tuple:
+    """
+    Plays a chunk of games between two computer players. Runs inside a worker process.
+    Cross starts the even games and Circle starts the odd ones.
+    :param task: (number of games, seed, cross strategy name, circle strategy name, width, height, win length)
+    :return: (cross wins, circle wins, ties)
+    """
+    games, seed, cross_strategy, circle_strategy, width, height, win_length = task
+    random.seed(seed)
+    cross_player = ComputerPlayer(PlayerMarker.Cross, STRATEGIES[cross_strategy]())
+    circle_player = ComputerPlayer(PlayerMarker.Circle, STRATEGIES[circle_strategy]())
+    cross_wins = circle_wins = ties = 0
+    for i in range(games):
+        if i % 2 == 0:
+            engine = GameEngine(cross_player, circle_player, width, height, win_length)
+        else:
+            engine = GameEngine(circle_player, cross_player, width, height, win_length)
+        winner = engine.play()
+        if winner is cross_player:
+            cross_wins += 1
+        elif winner is circle_player:
+            circle_wins += 1
+        else:
+            ties += 1
+    return cross_wins, circle_wins, ties
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plays ComputerPlayer against ComputerPlayer without any display.")
+    parser.add_argument("-n", "--games", type=int, default=100000, help="number of games to play")
+    parser.add_argument("-p", "--processes", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--chunk", type=int, default=10000, help="number of games that a worker plays per task")
+    parser.add_argument("--cross", choices=STRATEGIES, default="rules", help="strategy of X player")
+    parser.add_argument("--circle", choices=STRATEGIES, default="rules", help="strategy of O player")
+    parser.add_argument("--width", type=int, default=3)
+    parser.add_argument("--height", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    board = Board(args.width, args.height, args.win_length)
+    for name in dict.fromkeys((args.cross, args.circle)):
+        try:
+            STRATEGIES[name]().choose_move(board, PlayerMarker.Cross)
+        except ValueError as error:
+            parser.error(f"{name}: {error}")
+
+    tasks = []
+    remaining = args.games
+    while remaining > 0:
+        games = min(args.chunk, remaining)
+        tasks.append((games, args.seed + len(tasks), args.cross, args.circle, args.width, args.height,
+                      args.win_length))
+        remaining -= games
+
+    cross_wins = circle_wins = ties = 0
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.processes) as pool:
+        for result in pool.imap_unordered(play_games, tasks):
+            cross_wins += result[0]
+            circle_wins += result[1]
+            ties += result[2]
+    elapsed = time.perf_counter() - start
+
+    total = cross_wins + circle_wins + ties
+    print(f"Games: {total} ({args.cross} X vs {args.circle} O, {args.width}x{args.height}, "
+          f"{args.win_length} in a row, {args.processes} processes)")
+    for name, count in (("X won", cross_wins), ("O won", circle_wins), ("Tie", ties)):
+        print(f"{name:>6}: {count} ({100 * count / total:.2f}%)")
+    print(f"Elapsed: {elapsed:.2f} s, {total / elapsed:.0f} games per second")
+
+
+# main function will run only if the file was run directly, and not imported.
+if __name__ == "__main__":
+    main()
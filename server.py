@@ -0,0 +1,34 @@
+import argparse
+import asyncio
+import logging
+from Models.ServerModels import *
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hosts games against ComputerPlayer over line-delimited JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="path of a Unix socket to listen on instead of TCP")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="rules",
+                        help="strategy of computer; alphabeta and mcts search in a process pool")
+    parser.add_argument("--processes", type=int, help="number of search processes (default: number of CPUs)")
+    parser.add_argument("--max-sessions", type=int, default=10000)
+    parser.add_argument("--max-stores", type=int, default=16,
+                        help="maximum number of board sizes which can be played at the same time")
+    parser.add_argument("--idle-timeout", type=float, default=60.0, help="seconds before an idle session is evicted")
+    parser.add_argument("--finished-timeout", type=float, default=10.0,
+                        help="seconds a finished game is kept before its slot is released")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    game_server = GameServer(args.strategy, args.max_sessions, args.idle_timeout, args.finished_timeout,
+                             args.processes, args.max_stores)
+    try:
+        asyncio.run(game_server.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+# main function will run only if the file was run directly, and not imported.
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+import argparse
+import time
+from Models.TablebaseModels import *
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generates the 3x3 tablebase by retrograde analysis.")
+    parser.add_argument("-o", "--output", default=DEFAULT_TABLEBASE_PATH, help="path of tablebase file")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    positions = Tablebase.generate(args.output)
+    print(f"Solved {positions} positions in {time.perf_counter() - start:.2f} s; written to {args.output}")
+
+
+# main function will run only if the file was run directly, and not imported.
+if __name__ == "__main__":
+    main()
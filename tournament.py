@@ -0,0 +1,161 @@
+import argparse
+import itertools
+import math
+import multiprocessing
+import os
+import random
+import time
+from Models.StrategyModels import *
+
+
+def play_match(task: tuple) -> tuple:
+    """
+    Plays games between two strategies with fixed markers and starter. Runs inside a worker process.
+    :param task: (first strategy name, second strategy name, first marker is X, first starts, number of games, seed,
+    width, height, win length)
+    :return: (first strategy name, second strategy name, wins, ties, losses of first strategy,
+    dictionary of strategy name => (number of moves, total seconds, maximum seconds))
+    """
+    first, second, first_is_cross, first_starts, games, seed, width, height, win_length = task
+    random.seed(seed)
+    first_marker = PlayerMarker.Cross if first_is_cross else PlayerMarker.Circle
+    first_player = ComputerPlayer(first_marker, STRATEGIES[first]())
+    second_player = ComputerPlayer(first_marker.opponent, STRATEGIES[second]())
+    names = {first_player: first, second_player: second}
+    latencies = {first: [0, 0.0, 0.0], second: [0, 0.0, 0.0]}
+    wins = ties = losses = 0
+    for _ in range(games):
+        if first_starts:
+            engine = GameEngine(first_player, second_player, width, height, win_length)
+        else:
+            engine = GameEngine(second_player, first_player, width, height, win_length)
+        while not engine.is_finished:
+            latency = latencies[names[engine.current_player]]
+            start = time.perf_counter()
+            if engine.play_computer_move() is None:
+                raise RuntimeError(f"{names[engine.current_player]} did not choose a move.")
+            elapsed = time.perf_counter() - start
+            latency[0] += 1
+            latency[1] += elapsed
+            latency[2] = max(latency[2], elapsed)
+        if engine.winner is first_player:
+            wins += 1
+        elif engine.winner is second_player:
+            losses += 1
+        else:
+            ties += 1
+    return first, second, wins, ties, losses, {name: tuple(latency) for name, latency in latencies.items()}
+
+
+def elo_ratings(results: dict, prior: float = 1.0, iterations: int = 1000) -> dict:
+    """
+    Fits Bradley-Terry strengths to the results and converts them to Elo-style ratings with an average of 1500.
+    A tie counts as half a win for both strategies. Every pair also gets prior virtual ties, so a strategy which never
+    lost or never won still gets a finite rating.
+    :param results: Dictionary of (strategy name, strategy name) => [wins, ties, losses] of the first one.
+    :param prior: Number of virtual ties between every pair.
+    :param iterations: Maximum number of minorization-maximization updates.
+    :return: Dictionary of strategy name => rating.
+    """
+    names = sorted({name for pair in results for name in pair})
+    scores = {name: 0.0 for name in names}
+    games = {}
+    for (first, second), (wins, ties, losses) in results.items():
+        scores[first] += wins + ties / 2 + prior / 2
+        scores[second] += losses + ties / 2 + prior / 2
+        for pair in ((first, second), (second, first)):
+            games[pair] = games.get(pair, 0) + wins + ties + losses + prior
+    strengths = {name: 1.0 for name in names}
+    for _ in range(iterations):
+        updated = {}
+        for name in names:
+            denominator = sum(count / (strengths[name] + strengths[other])
+                              for (player, other), count in games.items() if player == name)
+            updated[name] = scores[name] / denominator if denominator else strengths[name]
+        # Strengths are only defined up to a factor; geometric mean is kept at 1.
+        scale = math.exp(sum(math.log(strength) for strength in updated.values()) / len(names))
+        updated = {name: strength / scale for name, strength in updated.items()}
+        converged = all(abs(updated[name] - strengths[name]) < 1e-9 * strengths[name] for name in names)
+        strengths = updated
+        if converged:
+            break
+    return {name: 1500 + 400 * math.log10(strength) for name, strength in strengths.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plays a round-robin tournament between strategies of ComputerPlayer.")
+    parser.add_argument("strategies", nargs="*", default=list(STRATEGIES),
+                        help=f"strategies which take part (default: all of {', '.join(STRATEGIES)})")
+    parser.add_argument("-n", "--games", type=int, default=100,
+                        help="number of games of every pair for each marker and starter (4 setups per pair)")
+    parser.add_argument("-p", "--processes", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--width", type=int, default=3)
+    parser.add_argument("--height", type=int, default=3)
+    parser.add_argument("--win-length", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    strategies = list(dict.fromkeys(args.strategies))
+    if len(strategies) < 2:
+        parser.error("at least two strategies are needed")
+    board = Board(args.width, args.height, args.win_length)
+    for name in strategies:
+        if name not in STRATEGIES:
+            parser.error(f"unknown strategy: {name}")
+        try:
+            STRATEGIES[name]().choose_move(board, PlayerMarker.Cross)
+        except ValueError as error:
+            parser.error(f"{name}: {error}")
+
+    tasks = []
+    for first, second in itertools.combinations(strategies, 2):
+        for first_is_cross, first_starts in itertools.product((True, False), repeat=2):
+            tasks.append((first, second, first_is_cross, first_starts, args.games, args.seed + len(tasks),
+                          args.width, args.height, args.win_length))
+
+    results = {pair: [0, 0, 0] for pair in itertools.combinations(strategies, 2)}
+    latencies = {name: [0, 0.0, 0.0] for name in strategies}
+    start = time.perf_counter()
+    with multiprocessing.Pool(args.processes) as pool:
+        for first, second, wins, ties, losses, match_latencies in pool.imap_unordered(play_match, tasks):
+            result = results[first, second]
+            result[0] += wins
+            result[1] += ties
+            result[2] += losses
+            for name, (moves, total, maximum) in match_latencies.items():
+                latency = latencies[name]
+                latency[0] += moves
+                latency[1] += total
+                latency[2] = max(latency[2], maximum)
+    elapsed = time.perf_counter() - start
+
+    # Results of every strategy against every other one from its own point of view.
+    table = {}
+    for (first, second), (wins, ties, losses) in results.items():
+        table[first, second] = (wins, ties, losses)
+        table[second, first] = (losses, ties, wins)
+    ratings = elo_ratings(results)
+    ranking = sorted(strategies, key=lambda name: ratings[name], reverse=True)
+
+    print(f"Tournament: {len(strategies)} strategies, {4 * args.games} games per pair, {args.width}x{args.height}, "
+          f"{args.win_length} in a row, {args.processes} processes")
+    width = max(len(name) for name in strategies)
+    cell = max(width, 14)
+    print("W/D/L".ljust(width) + "".join(f" {name:>{cell}}" for name in ranking))
+    for name in ranking:
+        cells = ("-" if name == other else "/".join(map(str, table[name, other])) for other in ranking)
+        print(name.ljust(width) + "".join(f" {text:>{cell}}" for text in cells))
+    print()
+    print(f"{'Strategy':<{width}} {'Elo':>6} {'W':>6} {'D':>6} {'L':>6} {'Mean ms':>9} {'Max ms':>9}")
+    for name in ranking:
+        wins, ties, losses = (sum(table[name, other][i] for other in strategies if other != name) for i in range(3))
+        moves, total, maximum = latencies[name]
+        mean = total / moves if moves else 0.0
+        print(f"{name:<{width}} {ratings[name]:>6.0f} {wins:>6} {ties:>6} {losses:>6} {mean * 1e3:>9.3f} "
+              f"{maximum * 1e3:>9.3f}")
+    print(f"Elapsed: {elapsed:.2f} s")
+
+
+# main function will run only if the file was run directly, and not imported.
+if __name__ == "__main__":
+    main()